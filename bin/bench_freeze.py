@@ -0,0 +1,39 @@
+"""Compare rendering live and frozen charts from a pool of threads."""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from chart_xkcd import Line, to_html
+
+assert len(sys.argv) <= 3, f"usage: {sys.argv[0]} [num_points] [renders_per_thread]"
+NUM_POINTS = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+RENDERS = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+THREADS = (1, 2, 4, 8)
+
+chart = Line(
+    title="bench",
+    labels=[str(i) for i in range(NUM_POINTS)],
+    datasets=[{"label": "a", "data": [i % 97 for i in range(NUM_POINTS)]}],
+)
+frozen = chart.freeze()
+
+
+def work(target):
+    for _ in range(RENDERS):
+        to_html(target, chart_js_url="chart.xkcd.js")
+
+
+gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+print(f"{NUM_POINTS} points, {RENDERS} renders per thread, GIL enabled: {gil}")
+print(f"{'threads':>7} {'live/s':>10} {'frozen/s':>10} {'speedup':>8}")
+for threads in THREADS:
+    rates = []
+    for target in (chart, frozen):
+        with ThreadPoolExecutor(threads) as pool:
+            start = time.perf_counter()
+            list(pool.map(work, [target] * threads))
+            elapsed = time.perf_counter() - start
+        rates.append(threads * RENDERS / elapsed)
+    live, still = rates
+    print(f"{threads:>7} {live:>10.1f} {still:>10.1f} {still / live:>8.1f}")
@@ -0,0 +1,54 @@
+/**
+ * Micro-benchmark for the Line chart's nearest-label lookup.
+ *
+ * Compares the per-event cost of the old approach (rebuild label
+ * positions, compute every distance, scan for the minimum) with
+ * binary search over positions computed once per render. Run with
+ * `npm run bench`; the binary-search column should stay roughly
+ * flat as the number of labels grows.
+ */
+import nearestIndex from '../src/utils/nearest';
+
+const EVENTS = 2000;
+
+function linearNearest(labels, position, x) {
+  const labelXs = labels.map(position);
+  let best = 0;
+  let bestDistance = Infinity;
+  labelXs.forEach((labelX, i) => {
+    const distance = Math.abs(labelX - x);
+    if (distance < bestDistance) {
+      best = i;
+      bestDistance = distance;
+    }
+  });
+  return best;
+}
+
+function timePerEvent(lookup, width) {
+  let checksum = 0;
+  const start = performance.now();
+  for (let e = 0; e < EVENTS; e += 1) {
+    checksum += lookup((e * 7919) % width);
+  }
+  return { micros: ((performance.now() - start) * 1000) / EVENTS, checksum };
+}
+
+const width = 1000;
+console.log('labels      linear (us/event)   binary (us/event)');
+[100, 1000, 10000, 100000].forEach((n) => {
+  const labels = Array.from({ length: n }, (_, i) => `label ${i}`);
+  const step = width / (n - 1);
+  const position = (label) => Number(label.slice(6)) * step;
+  const labelXs = labels.map(position);
+
+  const linear = timePerEvent((x) => linearNearest(labels, position, x), width);
+  const binary = timePerEvent((x) => nearestIndex(labelXs, x), width);
+  if (linear.checksum !== binary.checksum) {
+    throw new Error(`lookups disagree for ${n} labels`);
+  }
+  console.log(
+    `${String(n).padEnd(12)}${linear.micros.toFixed(2).padStart(17)}`
+    + `${binary.micros.toFixed(3).padStart(20)}`,
+  );
+});
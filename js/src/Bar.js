@@ -2,6 +2,7 @@ import { select, mouse, event as d3Event } from 'd3-selection';
 import { scaleBand, scaleLinear } from 'd3-scale';
 
 import addAxis from './utils/addAxis';
+import { extentOf, resolveExtent } from './utils/extent';
 import { tooltipPositionType } from './components/Tooltip';
 import config from './config';
 import {
@@ -25,11 +26,12 @@ import {
  * @param {string[]} params.data.labels - Category labels for the x-axis.
  * @param {Object[]} params.data.datasets - Array with a single dataset object
  *   containing a `data` array of numeric values and an optional `label`.
+ * @param {Object} [params.data.extent] - Precomputed `{ y: [min, max] }`.
  * @param {Object} [params.options] - See `applyDefaults` for common options.
  */
 class Bar {
   constructor(svg, {
-    title, xLabel, yLabel, data: { labels, datasets }, options,
+    title, xLabel, yLabel, data: { labels, datasets, extent }, options,
   }) {
     this.options = applyDefaults({
       yTickCount: config.defaultTickCount,
@@ -38,7 +40,7 @@ class Bar {
     this.title = title;
     this.xLabel = xLabel;
     this.yLabel = yLabel;
-    this.data = { labels, datasets };
+    this.data = { labels, datasets, extent };
 
     const margin = setupMargin({ title, xLabel, yLabel });
     const { filter, fontFamily } = resolveFilterAndFont(this.options, false);
@@ -63,11 +65,12 @@ class Bar {
       .domain(this.data.labels)
       .padding(config.bandPadding);
 
-    const allData = this.data.datasets
-      .reduce((pre, cur) => pre.concat(cur.data), []);
+    const yExtent = resolveExtent(
+      this.data.extent, 'y', () => extentOf(this.data.datasets),
+    );
 
     const yScale = scaleLinear()
-      .domain([0, Math.max(...allData)])
+      .domain([0, yExtent[1]])
       .range([this.height, 0]);
 
     const graphPart = this.chart.append('g');
@@ -4,6 +4,9 @@ import { scalePoint, scaleLinear } from 'd3-scale';
 
 import addAxis from './utils/addAxis';
 import addLegend from './utils/addLegend';
+import { extentOf, resolveExtent } from './utils/extent';
+import nearestIndex from './utils/nearest';
+import throttleFrame from './utils/frame';
 import { tooltipPositionType } from './components/Tooltip';
 import config from './config';
 import {
@@ -16,7 +19,10 @@ import {
  *
  * Supports multiple datasets rendered as separate colored lines.
  * A vertical hover line snaps to the nearest label and shows
- * a tooltip with values from all datasets at that point.
+ * a tooltip with values from all datasets at that point. The
+ * nearest label is found by binary search over label positions
+ * computed once per render, and hover updates are applied at
+ * most once per animation frame.
  * Includes click/shift-click selection and an optional legend.
  *
  * @param {SVGElement} svg - Target SVG element.
@@ -28,12 +34,13 @@ import {
  * @param {string[]} params.data.labels - Labels for each point along the x-axis.
  * @param {Object[]} params.data.datasets - Array of dataset objects, each with
  *   `data` (number[]), optional `label`, and optional `color`.
+ * @param {Object} [params.data.extent] - Precomputed `{ y: [min, max] }`.
  * @param {Object} [params.options] - Includes `showLegend`, `legendPosition`,
  *   and all common options from `applyDefaults`.
  */
 class Line {
   constructor(svg, {
-    title, xLabel, yLabel, data: { labels, datasets }, options,
+    title, xLabel, yLabel, data: { labels, datasets, extent }, options,
   }) {
     this.options = applyDefaults({
       yTickCount: config.defaultTickCount,
@@ -44,7 +51,7 @@ class Line {
     this.title = title;
     this.xLabel = xLabel;
     this.yLabel = yLabel;
-    this.data = { labels, datasets };
+    this.data = { labels, datasets, extent };
 
     const margin = setupMargin({ title, xLabel, yLabel });
     const { filter, fontFamily } = resolveFilterAndFont(this.options, false);
@@ -67,12 +74,14 @@ class Line {
     const xScale = scalePoint()
       .domain(this.data.labels)
       .range([0, this.width]);
+    const labelXs = this.data.labels.map((label) => xScale(label));
 
-    const allData = this.data.datasets
-      .reduce((pre, cur) => pre.concat(cur.data), []);
+    const yExtent = resolveExtent(
+      this.data.extent, 'y', () => extentOf(this.data.datasets),
+    );
 
     const yScale = scaleLinear()
-      .domain([Math.min(...allData), Math.max(...allData)])
+      .domain(yExtent)
       .range([this.height, 0]);
 
     const graphPart = this.chart.append('g')
@@ -98,7 +107,8 @@ class Line {
       .attr('filter', this.filter);
 
     const theLine = line()
-      .x((d, i) => xScale(this.data.labels[i]))
+      .defined((d) => d !== null)
+      .x((d, i) => labelXs[i])
       .y((d) => yScale(d))
       .curve(curveMonotoneX);
 
@@ -130,6 +140,39 @@ class Line {
       .attr('r', config.dotInitRadius)
       .style('visibility', 'hidden'));
 
+    const updateHover = throttleFrame((mouseX, mouseY) => {
+      const tipX = mouseX + this.margin.left + config.tooltipMouseOffset;
+      const tipY = mouseY + this.margin.top + config.tooltipMouseOffset;
+      const nearest = nearestIndex(labelXs, mouseX);
+      const nearestX = labelXs[nearest];
+
+      verticalLine
+        .attr('x1', nearestX)
+        .attr('x2', nearestX);
+
+      this.data.datasets.forEach((dataset, j) => {
+        circles[j]
+          .style('visibility', 'visible')
+          .attr('cx', nearestX)
+          .attr('cy', yScale(dataset.data[nearest]));
+      });
+
+      const tooltipItems = this.data.datasets.map((dataset, j) => ({
+        color: this.options.dataColors[j],
+        text: `${dataset.label || ''}: ${dataset.data[nearest]}`,
+      }));
+
+      tooltip.update({
+        title: this.data.labels[nearest],
+        items: tooltipItems,
+        position: {
+          x: tipX,
+          y: tipY,
+          type: tooltipPositionType(tipX, tipY, this.width, this.height),
+        },
+      });
+    });
+
     graphPart.append('rect')
       .attr('width', this.width)
       .attr('height', this.height)
@@ -140,62 +183,29 @@ class Line {
         tooltip.show();
       })
       .on('mouseout', () => {
+        updateHover.cancel();
         circles.forEach((circle) => circle.style('visibility', 'hidden'));
         verticalLine.style('visibility', 'hidden');
         tooltip.hide();
       })
       .on('click', (d, i, nodes) => {
         if (this.options.onSelect) {
-          const labelXs = this.data.labels.map((label) => xScale(label) + this.margin.left);
-          const mouseLabelDistances = labelXs.map(
-            (labelX) => Math.abs(labelX - mouse(nodes[i])[0] - this.margin.left),
-          );
-          const nearestIndex = mouseLabelDistances.indexOf(Math.min(...mouseLabelDistances));
+          const nearest = nearestIndex(labelXs, mouse(nodes[i])[0]);
           this.options.onSelect({
-            index: nearestIndex,
-            label: this.data.labels[nearestIndex],
+            index: nearest,
+            label: this.data.labels[nearest],
             values: this.data.datasets.map((dataset) => ({
               label: dataset.label,
-              value: dataset.data[nearestIndex],
+              value: dataset.data[nearest],
             })),
           }, d3Event.shiftKey);
         }
       })
       .on('mousemove', (d, i, nodes) => {
-        const tipX = mouse(nodes[i])[0] + this.margin.left + config.tooltipMouseOffset;
-        const tipY = mouse(nodes[i])[1] + this.margin.top + config.tooltipMouseOffset;
-
-        const labelXs = this.data.labels.map((label) => xScale(label) + this.margin.left);
-        const mouseLabelDistances = labelXs.map(
-          (labelX) => Math.abs(labelX - mouse(nodes[i])[0] - this.margin.left),
-        );
-        const nearestIndex = mouseLabelDistances.indexOf(Math.min(...mouseLabelDistances));
-
-        verticalLine
-          .attr('x1', xScale(this.data.labels[nearestIndex]))
-          .attr('x2', xScale(this.data.labels[nearestIndex]));
-
-        this.data.datasets.forEach((dataset, j) => {
-          circles[j]
-            .style('visibility', 'visible')
-            .attr('cx', xScale(this.data.labels[nearestIndex]))
-            .attr('cy', yScale(dataset.data[nearestIndex]));
-        });
-
-        const tooltipItems = this.data.datasets.map((dataset, j) => ({
-          color: this.options.dataColors[j],
-          text: `${this.data.datasets[j].label || ''}: ${this.data.datasets[j].data[nearestIndex]}`,
-        }));
-
-        tooltip.update({
-          title: this.data.labels[nearestIndex],
-          items: tooltipItems,
-          position: {
-            x: tipX,
-            y: tipY,
-            type: tooltipPositionType(tipX, tipY, this.width, this.height),
-          },
-        });
+        // d3's mouse() needs the live event, so read it now and defer
+        // the DOM updates to the next animation frame.
+        const [mouseX, mouseY] = mouse(nodes[i]);
+        updateHover(mouseX, mouseY);
       });
 
     if (this.options.showLegend) {
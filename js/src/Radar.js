@@ -3,6 +3,7 @@ import { line, curveLinearClosed } from 'd3-shape';
 import { scaleLinear } from 'd3-scale';
 
 import addLegend from './utils/addLegend';
+import { extentOf, resolveExtent } from './utils/extent';
 import { tooltipPositionType } from './components/Tooltip';
 import config from './config';
 import {
@@ -29,6 +30,7 @@ const angleOffset = -Math.PI / 2;
  * @param {string[]} params.data.labels - Axis labels (one per direction).
  * @param {Object[]} params.data.datasets - Array of dataset objects, each with
  *   `data` (number[]), optional `label`, and optional `color`.
+ * @param {Object} [params.data.extent] - Precomputed `{ y: [min, max] }`.
  * @param {Object} [params.options] - Includes `showLabels`, `ticksCount`,
  *   `dotSize`, `showLegend`, `legendPosition`, and all common
  *   options from `applyDefaults`.
@@ -36,7 +38,7 @@ const angleOffset = -Math.PI / 2;
 
 class Radar {
   constructor(svg, {
-    title, data: { labels, datasets }, options,
+    title, data: { labels, datasets, extent }, options,
   }) {
     this.options = applyDefaults({
       showLabels: false,
@@ -47,7 +49,7 @@ class Radar {
       ...options,
     }, datasets);
     this.title = title;
-    this.data = { labels, datasets };
+    this.data = { labels, datasets, extent };
     this.directionsCount = datasets[0].data.length;
 
     const { filter, fontFamily } = resolveFilterAndFont(this.options, true);
@@ -71,9 +73,9 @@ class Radar {
     const radius = Math.min(this.width, this.height) / 2 - config.marginScalar;
     const angleStep = (Math.PI * 2) / this.directionsCount;
 
-    const allDataValues = this.data.datasets
-      .reduce((acc, cur) => acc.concat(cur.data), []);
-    const maxValue = Math.max(...allDataValues);
+    const maxValue = resolveExtent(
+      this.data.extent, 'y', () => extentOf(this.data.datasets),
+    )[1];
     const allMaxData = Array(this.directionsCount).fill(maxValue);
     const valueScale = scaleLinear()
       .domain([0, maxValue])
@@ -5,6 +5,7 @@ import dayjs from 'dayjs';
 
 import addAxis from './utils/addAxis';
 import addLegend from './utils/addLegend';
+import { extentOf, resolveExtent } from './utils/extent';
 import { tooltipPositionType } from './components/Tooltip';
 import config from './config';
 import {
@@ -17,7 +18,8 @@ import {
  *
  * Each dataset contains an array of `{x, y}` points. Dots grow
  * on hover to show a tooltip. Supports time-formatted x-values
- * (via the `timeFormat` option and dayjs), click/shift-click
+ * (via the `timeFormat` option; epoch-millisecond numbers are used
+ * directly, other values are parsed with dayjs), click/shift-click
  * selection, and drag-to-select (box selection) that reports all
  * enclosed points.
  *
@@ -29,13 +31,15 @@ import {
  * @param {Object} params.data
  * @param {Object[]} params.data.datasets - Array of dataset objects, each with
  *   `data` ({x,y}[]), optional `label`, and optional `color`.
+ * @param {Object} [params.data.extent] - Precomputed `{ x: [min, max],
+ *   y: [min, max] }`; either axis may be missing.
  * @param {Object} [params.options] - Includes `dotSize`, `showLine`,
  *   `timeFormat`, `xTickCount`, `yTickCount`, `showLegend`,
  *   `legendPosition`, and all common options from `applyDefaults`.
  */
 class Scatter {
   constructor(svg, {
-    title, xLabel, yLabel, data: { datasets }, options,
+    title, xLabel, yLabel, data: { datasets, extent }, options,
   }) {
     this.options = applyDefaults({
       dotSize: 1,
@@ -50,7 +54,7 @@ class Scatter {
     this.title = title;
     this.xLabel = xLabel;
     this.yLabel = yLabel;
-    this.data = { datasets };
+    this.data = { datasets, extent };
 
     const margin = setupMargin({ title, xLabel, yLabel });
     const { filter, fontFamily } = resolveFilterAndFont(this.options, false);
@@ -70,32 +74,34 @@ class Scatter {
   render() {
     const tooltip = createTooltip(this.svgEl, this.options);
 
-    if (this.options.timeFormat) {
-      this.data.datasets.forEach((dataset) => {
-        dataset.data.forEach((d) => {
-          d.x = dayjs(d.x);
-        });
-      });
-    }
-
-    const allData = this.data.datasets
-      .reduce((pre, cur) => pre.concat(cur.data), []);
+    // Numeric x-values (e.g. epoch milliseconds) are used as they are;
+    // only non-numeric times are parsed, once each, into a separate
+    // array so that the caller's data is left untouched.
+    const { timeFormat } = this.options;
+    const xs = this.data.datasets.map(({ data }) => (timeFormat
+      ? data.map((d) => (typeof d.x === 'number' ? d.x : +dayjs(d.x)))
+      : data.map((d) => d.x)));
+    const groupOf = (nodes, i) => Number(select(nodes[i].parentElement).attr('xy-group-index'));
 
-    const allDataX = allData.map((d) => d.x);
-    const allDataY = allData.map((d) => d.y);
+    const xExtent = resolveExtent(
+      this.data.extent, 'x', () => extentOf(xs.map((data) => ({ data }))),
+    );
+    const yExtent = resolveExtent(
+      this.data.extent, 'y', () => extentOf(this.data.datasets, (d) => d.y),
+    );
 
     let xScale = scaleLinear()
-      .domain([Math.min(...allDataX), Math.max(...allDataX)])
+      .domain(xExtent)
       .range([0, this.width]);
 
     if (this.options.timeFormat) {
       xScale = scaleTime()
-        .domain([Math.min(...allDataX), Math.max(...allDataX)])
+        .domain(xExtent)
         .range([0, this.width]);
     }
 
     const yScale = scaleLinear()
-      .domain([Math.min(...allDataY), Math.max(...allDataY)])
+      .domain(yExtent)
       .range([this.height, 0]);
 
     const graphPart = this.chart.append('g')
@@ -119,8 +125,8 @@ class Scatter {
 
     // lines
     if (this.options.showLine) {
-      const theLine = line()
-        .x((d) => xScale(d.x))
+      const theLine = (k) => line()
+        .x((d, i) => xScale(xs[k][i]))
         .y((d) => yScale(d.y))
         .curve(curveMonotoneX);
 
@@ -129,7 +135,7 @@ class Scatter {
         .enter()
         .append('path')
         .attr('class', 'xkcd-chart-xyline')
-        .attr('d', (d) => theLine(d.data))
+        .attr('d', (d, k) => theLine(k)(d.data))
         .attr('fill', 'none')
         .attr('stroke', (d, i) => this.options.dataColors[i])
         .attr('filter', this.filter);
@@ -149,21 +155,15 @@ class Scatter {
       .data((dataset) => dataset.data)
       .enter()
       .append('circle')
-      .style('stroke', (d, i, nodes) => {
-        const xyGroupIndex = Number(select(nodes[i].parentElement).attr('xy-group-index'));
-        return this.options.dataColors[xyGroupIndex];
-      })
-      .style('fill', (d, i, nodes) => {
-        const xyGroupIndex = Number(select(nodes[i].parentElement).attr('xy-group-index'));
-        return this.options.dataColors[xyGroupIndex];
-      })
+      .style('stroke', (d, i, nodes) => this.options.dataColors[groupOf(nodes, i)])
+      .style('fill', (d, i, nodes) => this.options.dataColors[groupOf(nodes, i)])
       .attr('r', dotInitSize)
-      .attr('cx', (d) => xScale(d.x))
+      .attr('cx', (d, i, nodes) => xScale(xs[groupOf(nodes, i)][i]))
       .attr('cy', (d) => yScale(d.y))
       .attr('pointer-events', 'all')
       .on('click', (d, i, nodes) => {
         if (this.options.onSelect) {
-          const xyGroupIndex = Number(select(nodes[i].parentElement).attr('xy-group-index'));
+          const xyGroupIndex = groupOf(nodes, i);
           this.options.onSelect({
             dataset_index: xyGroupIndex,
             point_index: i,
@@ -174,14 +174,14 @@ class Scatter {
         }
       })
       .on('mouseover', (d, i, nodes) => {
-        const xyGroupIndex = Number(select(nodes[i].parentElement).attr('xy-group-index'));
+        const xyGroupIndex = groupOf(nodes, i);
         select(nodes[i]).attr('r', dotHoverSize);
-        const tipX = xScale(d.x) + this.margin.left + config.scatterMouseOffset;
+        const tipX = xScale(xs[xyGroupIndex][i]) + this.margin.left + config.scatterMouseOffset;
         const tipY = yScale(d.y) + this.margin.top + config.scatterMouseOffset;
         tooltip.update({
-          title: this.options.timeFormat
-            ? dayjs(this.data.datasets[xyGroupIndex].data[i].x).format(this.options.timeFormat)
-            : `${this.data.datasets[xyGroupIndex].data[i].x}`,
+          title: timeFormat
+            ? dayjs(xs[xyGroupIndex][i]).format(timeFormat)
+            : `${d.x}`,
           items: [{
             color: this.options.dataColors[xyGroupIndex],
             text: `${this.data.datasets[xyGroupIndex].label || ''}: ${d.y}`,
@@ -271,7 +271,8 @@ class Scatter {
           const selected = [];
           this.data.datasets.forEach((dataset, dsIdx) => {
             dataset.data.forEach((d, ptIdx) => {
-              if (d.x >= dataX0 && d.x <= dataX1 && d.y >= dataY0 && d.y <= dataY1) {
+              const x = xs[dsIdx][ptIdx];
+              if (x >= dataX0 && x <= dataX1 && d.y >= dataY0 && d.y <= dataY1) {
                 selected.push({
                   dataset_index: dsIdx,
                   point_index: ptIdx,
@@ -3,6 +3,7 @@ import { scaleBand, scaleLinear } from 'd3-scale';
 
 import addAxis from './utils/addAxis';
 import addLegend from './utils/addLegend';
+import { stackedExtentOf, resolveExtent } from './utils/extent';
 import { tooltipPositionType } from './components/Tooltip';
 import config from './config';
 import {
@@ -26,12 +27,14 @@ import {
  * @param {string[]} params.data.labels - Category labels for the x-axis.
  * @param {Object[]} params.data.datasets - Array of dataset objects, each with
  *   `data` (number[]), optional `label`, and optional `color`.
+ * @param {Object} [params.data.extent] - Precomputed `{ y: [min, max] }`
+ *   of the column totals.
  * @param {Object} [params.options] - Includes `showLegend`, `legendPosition`,
  *   and all common options from `applyDefaults`.
  */
 class StackedBar {
   constructor(svg, {
-    title, xLabel, yLabel, data: { labels, datasets }, options,
+    title, xLabel, yLabel, data: { labels, datasets, extent }, options,
   }) {
     this.options = applyDefaults({
       yTickCount: config.defaultTickCount,
@@ -42,7 +45,7 @@ class StackedBar {
     this.title = title;
     this.xLabel = xLabel;
     this.yLabel = yLabel;
-    this.data = { labels, datasets };
+    this.data = { labels, datasets, extent };
 
     const margin = setupMargin({ title, xLabel, yLabel });
     const { filter, fontFamily } = resolveFilterAndFont(this.options, false);
@@ -67,11 +70,12 @@ class StackedBar {
       .domain(this.data.labels)
       .padding(config.bandPadding);
 
-    const allCols = this.data.datasets
-      .reduce((r, a) => a.data.map((b, i) => (r[i] || 0) + b), []);
+    const yExtent = resolveExtent(
+      this.data.extent, 'y', () => stackedExtentOf(this.data.datasets),
+    );
 
     const yScale = scaleLinear()
-      .domain([0, Math.max(...allCols)])
+      .domain([0, yExtent[1]])
       .range([this.height, 0]);
 
     const graphPart = this.chart.append('g');
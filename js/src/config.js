@@ -75,6 +75,11 @@ const config = {
 
   // Selection box
   boxSelectMinDrag: 4,
+
+  // Zoomable widgets: range change per wheel step, and the smallest
+  // visible range as a fraction of the full range
+  zoomStep: 1.25,
+  zoomMinFraction: 1e-6,
 };
 
 export default config;
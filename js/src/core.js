@@ -0,0 +1,16 @@
+/**
+ * Shared entry point for the code-split build.
+ *
+ * Pages that load the per-chart modules (`Bar.js`, `Line.js`, ...)
+ * import `setFontUrl` from here to point the charts at the
+ * standalone font file, `resolveRefs` to use page-level shared
+ * data, `fitToContainer` to make charts follow their container's
+ * size and `measureChart` to log render timings. Code shared by
+ * several chart modules ends up in common chunks that every page
+ * loads at most once.
+ */
+export { setFontUrl } from './utils/addFont';
+export { default as config } from './config';
+export { default as resolveRefs } from './utils/refs';
+export { default as fitToContainer } from './utils/resize';
+export { measureChart } from './utils/stats';
@@ -9,7 +9,23 @@ import Radar from './Radar';
 import Scatter from './Scatter';
 import StackedBar from './StackedBar';
 import config from './config';
+import { setFontUrl } from './utils/addFont';
+import fontDataUrl from './utils/fontData';
+import resolveRefs from './utils/refs';
+import fitToContainer from './utils/resize';
+import { measureChart } from './utils/stats';
+
+setFontUrl(fontDataUrl);
 
 module.exports = {
-  config, Bar, Line, Pie, Radar, Scatter, StackedBar
+  config,
+  Bar,
+  Line,
+  Pie,
+  Radar,
+  Scatter,
+  StackedBar,
+  fitToContainer,
+  measureChart,
+  resolveRefs,
 };
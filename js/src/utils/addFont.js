@@ -1,8 +1,12 @@
 /**
  * Font loading utilities.
  *
- * The xkcd handwriting font is embedded as a base64 data-URL in
- * fontData.js (generated at build time by bin/font_encode.py).
+ * The xkcd handwriting font is loaded from a URL set with
+ * `setFontUrl()`. The single-file bundles (`widget.js`, `index.js`)
+ * set it to the base64 data-URL in fontData.js (generated at build
+ * time by bin/font_encode.py); pages using the code-split modules
+ * set it to the standalone `xkcd-script.ttf` file instead, which the
+ * browser downloads and caches separately from the JavaScript.
  * Two loading mechanisms are provided:
  *
  * - `loadFont()` registers the font via the CSS Font Loading API
@@ -12,18 +16,30 @@
  *   `<defs>` so the font is available inside the SVG context.
  *   Called by each chart's setup helpers.
  */
-import fontDataUrl from './fontData';
+
+/** URL of the font, or null if none has been set. */
+let fontUrl = null;
 
 /** Prevents registering the font more than once per page load. */
 let fontLoaded = false;
 
+/**
+ * Set the URL the xkcd font is loaded from.
+ *
+ * @param {string} url - Font URL (a file URL or a data URL).
+ */
+export function setFontUrl(url) {
+  fontUrl = url;
+  fontLoaded = false;
+}
+
 /**
  * Register the xkcd font with the browser using the FontFace API.
  * Subsequent calls are no-ops.
  */
 export async function loadFont() {
-  if (fontLoaded) return;
-  const font = new FontFace('xkcd', `url("${fontDataUrl}")`);
+  if (fontLoaded || fontUrl === null) return;
+  const font = new FontFace('xkcd', `url("${fontUrl}")`);
   const loaded = await font.load();
   document.fonts.add(loaded);
   fontLoaded = true;
@@ -36,11 +52,12 @@ export async function loadFont() {
  * @param {d3.Selection} parent - d3 selection of the root SVG element.
  */
 export default function addFont(parent) {
+  if (fontUrl === null) return;
   parent.append('defs')
     .append('style')
     .attr('type', 'text/css')
     .text(`@font-face {
       font-family: "xkcd";
-      src: url("${fontDataUrl}") format("truetype");
+      src: url("${fontUrl}") format("truetype");
     }`);
 }
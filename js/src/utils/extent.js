@@ -0,0 +1,60 @@
+/**
+ * Single-pass extent helpers.
+ *
+ * The Python chart classes precompute scale domains and send them
+ * as `data.extent`. These helpers are the fallback used when a
+ * config has no precomputed extent (e.g. when the JS library is
+ * used directly). They visit each value once and never spread
+ * values into function arguments, so they work for any data size.
+ */
+
+/**
+ * Return `[min, max]` of the values in all datasets, skipping missing
+ * (`null`) values.
+ *
+ * @param {Object[]} datasets - Dataset objects with a `data` array.
+ * @param {Function} [accessor] - Maps each data item to a number.
+ * @returns {number[]} `[min, max]`, or `[Infinity, -Infinity]` when empty.
+ */
+export function extentOf(datasets, accessor = (d) => d) {
+  let min = Infinity;
+  let max = -Infinity;
+  for (let i = 0; i < datasets.length; i += 1) {
+    const { data } = datasets[i];
+    for (let j = 0; j < data.length; j += 1) {
+      const item = accessor(data[j]);
+      if (item === null || item === undefined) continue;
+      const value = +item;
+      if (value < min) min = value;
+      if (value > max) max = value;
+    }
+  }
+  return [min, max];
+}
+
+/**
+ * Return `[min, max]` of the column totals of stacked datasets.
+ *
+ * @param {Object[]} datasets - Dataset objects with equal-length `data` arrays.
+ * @returns {number[]} `[min, max]`, or `[Infinity, -Infinity]` when empty.
+ */
+export function stackedExtentOf(datasets) {
+  const totals = new Float64Array(datasets.length ? datasets[0].data.length : 0);
+  datasets.forEach(({ data }) => {
+    for (let j = 0; j < totals.length; j += 1) totals[j] += +data[j];
+  });
+  return extentOf([{ data: totals }]);
+}
+
+/**
+ * Return a precomputed extent for an axis, or compute one.
+ *
+ * @param {Object} [extent] - `data.extent` from the chart config.
+ * @param {string} axis - `'x'` or `'y'`.
+ * @param {Function} compute - Called to compute the extent when missing.
+ * @returns {number[]} `[min, max]`.
+ */
+export function resolveExtent(extent, axis, compute) {
+  if (extent && extent[axis]) return extent[axis];
+  return compute();
+}
@@ -0,0 +1,35 @@
+/**
+ * Wrap a function so that bursts of calls run it at most once per
+ * animation frame, with the arguments of the latest call.
+ *
+ * The returned function has a `cancel()` method that drops any call
+ * still waiting for the next frame.
+ *
+ * @param {Function} fn - Function to throttle.
+ * @returns {Function} Throttled function.
+ */
+export default function throttleFrame(fn) {
+  const requestFrame = typeof window !== 'undefined' && window.requestAnimationFrame
+    ? (cb) => window.requestAnimationFrame(cb)
+    : (cb) => setTimeout(cb, 16);
+  const cancelFrame = typeof window !== 'undefined' && window.cancelAnimationFrame
+    ? (id) => window.cancelAnimationFrame(id)
+    : (id) => clearTimeout(id);
+
+  let pending = null;
+  let latestArgs = null;
+
+  const throttled = (...args) => {
+    latestArgs = args;
+    if (pending !== null) return;
+    pending = requestFrame(() => {
+      pending = null;
+      fn(...latestArgs);
+    });
+  };
+  throttled.cancel = () => {
+    if (pending !== null) cancelFrame(pending);
+    pending = null;
+  };
+  return throttled;
+}
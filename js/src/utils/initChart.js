@@ -3,6 +3,7 @@ import { select } from 'd3-selection';
 import addFont from './addFont';
 import addFilter from './addFilter';
 import addLabels from './addLabels';
+import { measure } from './stats';
 import Tooltip from '../components/Tooltip';
 import colors from './colors';
 import config from '../config';
@@ -54,20 +55,28 @@ export function resolveFilterAndFont(options, usePieFilter) {
 
 /**
  * Create and configure the root SVG element.
+ *
+ * The chart is laid out in a `viewBox` of the initial size, so that
+ * changing the SVG's width and height later (see `fitToContainer`)
+ * rescales the drawing without rebuilding it.
  */
 export function createSvgEl(svg, { strokeWidth, fontFamily, backgroundColor }) {
+  const width = svg.parentElement.clientWidth;
+  const height = Math.min(width * config.aspectRatio, window.innerHeight);
   const svgEl = select(svg)
     .style('stroke-width', strokeWidth || config.svgStrokeWidth)
     .style('font-family', fontFamily)
     .style('background', backgroundColor)
-    .attr('width', svg.parentElement.clientWidth)
-    .attr('height', Math.min(svg.parentElement.clientWidth * config.aspectRatio, window.innerHeight));
+    .attr('width', width)
+    .attr('height', height)
+    .attr('viewBox', `0 0 ${width} ${height}`);
   svgEl.selectAll('*').remove();
   return svgEl;
 }
 
 /**
  * Append the main chart group, add font/filter defs, and render labels.
+ * Adding the defs is timed as the `setup` phase (see `measureChart`).
  * Returns { chart, width, height }.
  */
 export function setupChartGroup(svgEl, margin, { title, xLabel, yLabel, strokeColor }) {
@@ -76,8 +85,10 @@ export function setupChartGroup(svgEl, margin, { title, xLabel, yLabel, strokeCo
   const width = svgEl.attr('width') - margin.left - margin.right;
   const height = svgEl.attr('height') - margin.top - margin.bottom;
 
-  addFont(svgEl);
-  addFilter(svgEl);
+  measure('setup', () => {
+    addFont(svgEl);
+    addFilter(svgEl);
+  });
 
   if (title) addLabels.title(svgEl, title, strokeColor);
   if (xLabel) addLabels.xLabel(svgEl, xLabel, strokeColor);
@@ -97,8 +108,10 @@ export function setupChartGroupSimple(svgEl, { title, strokeColor }) {
   const width = svgEl.attr('width');
   const height = svgEl.attr('height');
 
-  addFont(svgEl);
-  addFilter(svgEl);
+  measure('setup', () => {
+    addFont(svgEl);
+    addFilter(svgEl);
+  });
 
   if (title) addLabels.title(svgEl, title, strokeColor);
 
@@ -0,0 +1,28 @@
+/**
+ * Find the index of the position closest to `x`.
+ *
+ * Uses binary search, so the cost grows logarithmically with the
+ * number of positions. Ties go to the earlier position.
+ *
+ * @param {number[]} positions - Positions sorted in ascending order.
+ * @param {number} x - Position to look up.
+ * @returns {number} Index into `positions`, or -1 if it is empty.
+ */
+export default function nearestIndex(positions, x) {
+  const n = positions.length;
+  if (n === 0) return -1;
+  let lo = 0;
+  let hi = n - 1;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (positions[mid] < x) {
+      lo = mid + 1;
+    } else {
+      hi = mid;
+    }
+  }
+  if (lo > 0 && x - positions[lo - 1] <= positions[lo] - x) {
+    return lo - 1;
+  }
+  return lo;
+}
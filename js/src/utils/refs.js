@@ -0,0 +1,41 @@
+/**
+ * Page-level shared data.
+ *
+ * Pages showing several charts over the same data (see the
+ * `share_data` option of `to_html_page` in Python) serialize each
+ * distinct array once in a JSON block and replace every use of it in
+ * the chart configs with `{ "$ref": id }`. `resolveRefs` swaps the
+ * references for the shared arrays just before a chart is
+ * constructed, so charts over the same data share one array object.
+ */
+
+/**
+ * Return the shared array a value refers to, or the value itself.
+ *
+ * @param {*} value - Array, or `{ $ref: id }` reference.
+ * @param {Object} registry - Shared arrays keyed by ID.
+ * @returns {*} The resolved value.
+ */
+function lookup(value, registry) {
+  if (value && !Array.isArray(value) && typeof value === 'object' && '$ref' in value) {
+    return registry[value.$ref];
+  }
+  return value;
+}
+
+/**
+ * Resolve references to shared data in a chart config.
+ *
+ * Only `data.labels` and each dataset's `data` can be references.
+ * The config is copied rather than modified.
+ *
+ * @param {Object} config - Chart config (title, data, options).
+ * @param {Object} registry - Shared arrays keyed by ID.
+ * @returns {Object} Config with every reference replaced.
+ */
+export default function resolveRefs(config, registry) {
+  const data = { ...config.data };
+  if ('labels' in data) data.labels = lookup(data.labels, registry);
+  data.datasets = data.datasets.map((ds) => ({ ...ds, data: lookup(ds.data, registry) }));
+  return { ...config, data };
+}
@@ -0,0 +1,37 @@
+import throttleFrame from './frame';
+
+/**
+ * Keep a chart's SVG as wide as its container by rescaling it.
+ *
+ * Charts are drawn inside a `viewBox` (see `createSvgEl`), so when
+ * the container changes size this only updates the SVG's width and
+ * height, keeping the drawing's aspect ratio; nothing is redrawn.
+ * Size changes are observed with `ResizeObserver` where available
+ * (window resizes otherwise) and applied at most once per frame.
+ *
+ * @param {SVGElement} svg - Root SVG element of a chart.
+ * @returns {Function} Call to stop following the container's size.
+ */
+export default function fitToContainer(svg) {
+  const fit = throttleFrame(() => {
+    const box = svg.viewBox && svg.viewBox.baseVal;
+    const width = svg.parentElement ? svg.parentElement.clientWidth : 0;
+    if (!box || !box.width || !width) return;
+    svg.setAttribute('width', width);
+    svg.setAttribute('height', (width * box.height) / box.width);
+  });
+
+  if (window.ResizeObserver) {
+    const observer = new window.ResizeObserver(() => fit());
+    observer.observe(svg.parentElement);
+    return () => {
+      fit.cancel();
+      observer.disconnect();
+    };
+  }
+  window.addEventListener('resize', fit);
+  return () => {
+    fit.cancel();
+    window.removeEventListener('resize', fit);
+  };
+}
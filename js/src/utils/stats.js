@@ -0,0 +1,135 @@
+/**
+ * Front-end render telemetry.
+ *
+ * `measureChart` constructs a chart while recording how long each
+ * phase takes with `performance.mark`/`performance.measure` (so the
+ * phases also show up in the browser's performance tools), counts
+ * the SVG's DOM nodes, and reports the results once the chart has
+ * been painted. Phases measured inside chart construction (such as
+ * `setup` in `initChart.js`) are recorded with `measure`, which does
+ * nothing unless a chart is being measured.
+ */
+import throttleFrame from './frame';
+
+const PREFIX = 'chart.xkcd';
+
+/** Stats of the chart currently being measured, if any. */
+let active = null;
+
+/** Number of charts measured so far, used to keep mark names unique. */
+let count = 0;
+
+/**
+ * Mark the start of a phase; the returned function marks its end.
+ *
+ * The marks and the measure between them are cleared as soon as the
+ * phase's duration has been recorded.
+ *
+ * @param {Object} stats - Stats to record the phase's duration into.
+ * @param {string} phase - Phase name.
+ * @returns {Function} Ends the phase.
+ */
+function begin(stats, phase) {
+  const perf = window.performance;
+  const name = `${PREFIX}:${stats.id}:${phase}`;
+  const start = perf.now();
+  perf.mark(`${name}:start`);
+  return () => {
+    perf.mark(`${name}:end`);
+    perf.measure(name, `${name}:start`, `${name}:end`);
+    stats.phases[phase] = (stats.phases[phase] || 0) + (perf.now() - start);
+    // Profilers have seen the entries by now; drop them so that
+    // repeated redraws do not grow the performance timeline.
+    perf.clearMarks(`${name}:start`);
+    perf.clearMarks(`${name}:end`);
+    perf.clearMeasures(name);
+  };
+}
+
+/**
+ * Run a function as a named phase of the chart being measured.
+ *
+ * @param {string} phase - Phase name.
+ * @param {Function} fn - Function to run.
+ * @param {Object} [stats] - Stats to record into (default: the active ones).
+ * @returns {*} Whatever `fn` returns.
+ */
+export function measure(phase, fn, stats = active) {
+  if (!stats || !window.performance) return fn();
+  const end = begin(stats, phase);
+  const previous = active;
+  active = stats;
+  try {
+    return fn();
+  } finally {
+    active = previous;
+    end();
+  }
+}
+
+/**
+ * Await an asynchronous function as a named phase.
+ *
+ * @param {string} phase - Phase name.
+ * @param {Function} fn - Function returning a promise.
+ * @param {Object} stats - Stats to record into.
+ * @returns {Promise} Whatever `fn` resolves to.
+ */
+export async function measureAsync(phase, fn, stats) {
+  if (!stats || !window.performance) return fn();
+  const end = begin(stats, phase);
+  try {
+    return await fn();
+  } finally {
+    end();
+  }
+}
+
+/**
+ * Start recording stats for one chart.
+ *
+ * @param {string} chartType - Name of the chart class.
+ * @returns {Object} Empty stats: `{ id, chartType, phases, nodes }`.
+ */
+export function startStats(chartType) {
+  count += 1;
+  return {
+    id: `${chartType}-${count}`, chartType, phases: {}, nodes: 0,
+  };
+}
+
+/**
+ * Construct a chart and report how long it took to build and paint.
+ *
+ * The stats passed to `report` hold the time in milliseconds spent in
+ * each phase (`construct`, `setup`, plus any measured by the caller),
+ * the time from the start of construction to the next frame
+ * (`paint`), and the number of elements in the SVG (`nodes`).
+ *
+ * @param {string} chartType - Name of the chart class.
+ * @param {Function} ChartClass - Chart class to construct.
+ * @param {SVGElement} svg - Target SVG element.
+ * @param {Object} config - Chart config.
+ * @param {Object} [opts]
+ * @param {Function} [opts.report] - Called with the stats after painting
+ *   (default: log them to the console).
+ * @param {Object} [opts.stats] - Stats to add to (default: new ones).
+ * @returns {Object} The chart instance.
+ */
+export function measureChart(chartType, ChartClass, svg, config, opts = {}) {
+  const stats = opts.stats || startStats(chartType);
+  const perf = window.performance;
+  const start = perf ? perf.now() : 0;
+  const chart = measure('construct', () => new ChartClass(svg, config), stats);
+  stats.nodes = svg.getElementsByTagName('*').length + 1;
+  // The frame after the next one starts once the chart has been painted.
+  throttleFrame(() => throttleFrame(() => {
+    if (perf) stats.phases.paint = perf.now() - start;
+    if (opts.report) {
+      opts.report(stats);
+    } else {
+      console.log(`${PREFIX} render stats`, stats); // eslint-disable-line no-console
+    }
+  })())();
+  return chart;
+}
@@ -0,0 +1,66 @@
+import config from '../config';
+
+/**
+ * Wheel-driven zoom and pan over a chart's x-range.
+ *
+ * The mouse wheel zooms in or out around the cursor; shift-wheel or
+ * horizontal scrolling pans; double-click resets to the full range.
+ * The new range is clamped to `[min, max]` and reported through
+ * `onChange`; fetching and drawing the data for it is up to the caller.
+ *
+ * @param {SVGElement} svg - Root SVG element of the chart.
+ * @param {Object} params
+ * @param {Function} params.getChart - Returns the current chart instance
+ *   (used for its `width` and `margin`).
+ * @param {Function} params.getWindow - Returns the current
+ *   `{ x0, x1, min, max }` window, or null if the chart is not zoomable.
+ * @param {Function} params.onChange - Called with `{ x0, x1 }`.
+ */
+export default function attachZoom(svg, { getChart, getWindow, onChange }) {
+  svg.addEventListener('wheel', (event) => {
+    const win = getWindow();
+    if (!win) return;
+    event.preventDefault();
+
+    const chart = getChart();
+    const rect = svg.getBoundingClientRect();
+    // Screen pixels per chart unit, when the SVG is rescaled by its viewBox.
+    const scale = rect.width / ((svg.viewBox && svg.viewBox.baseVal.width) || rect.width);
+    const fraction = Math.min(Math.max(
+      ((event.clientX - rect.left) / scale - chart.margin.left) / chart.width, 0,
+    ), 1);
+    const full = win.max - win.min;
+    const span = win.x1 - win.x0;
+    let x0;
+    let x1;
+
+    const horizontal = Math.abs(event.deltaX) > Math.abs(event.deltaY);
+    if (event.shiftKey || horizontal) {
+      const delta = horizontal ? event.deltaX : event.deltaY;
+      const shift = (delta / scale / chart.width) * span;
+      x0 = win.x0 + shift;
+      x1 = win.x1 + shift;
+    } else {
+      const factor = event.deltaY > 0 ? config.zoomStep : 1 / config.zoomStep;
+      const newSpan = Math.min(full, Math.max(span * factor, full * config.zoomMinFraction));
+      const center = win.x0 + fraction * span;
+      x0 = center - fraction * newSpan;
+      x1 = x0 + newSpan;
+    }
+
+    if (x0 < win.min) {
+      x1 += win.min - x0;
+      x0 = win.min;
+    }
+    if (x1 > win.max) {
+      x0 -= x1 - win.max;
+      x1 = win.max;
+    }
+    onChange({ x0: Math.max(x0, win.min), x1 });
+  }, { passive: false });
+
+  svg.addEventListener('dblclick', () => {
+    const win = getWindow();
+    if (win) onChange({ x0: win.min, x1: win.max });
+  });
+}
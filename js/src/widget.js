@@ -7,6 +7,17 @@
  * from the widget model's traitlets, renders the appropriate
  * chart, and wires up click/shift-click/box-select callbacks
  * that write the current selection back to the model.
+ *
+ * Changes to the model are coalesced into at most one redraw per
+ * animation frame, so that `to_widget(..., key=...)` can update an
+ * existing widget without rebuilding its DOM.
+ *
+ * Zoomable widgets keep their full data on the Python side. The
+ * front-end sends the visible x-range as a `window` custom message
+ * and redraws with the downsampled config sent back in reply.
+ *
+ * Every draw is timed (see `utils/stats`) and the results are written
+ * to the model's `render_stats` traitlet as JSON.
  */
 import Bar from './Bar';
 import Line from './Line';
@@ -14,19 +25,35 @@ import Pie from './Pie';
 import Radar from './Radar';
 import Scatter from './Scatter';
 import StackedBar from './StackedBar';
-import { loadFont } from './utils/addFont';
+import { loadFont, setFontUrl } from './utils/addFont';
+import fontDataUrl from './utils/fontData';
+import throttleFrame from './utils/frame';
+import resolveRefs from './utils/refs';
+import fitToContainer from './utils/resize';
+import { measureAsync, measureChart, startStats } from './utils/stats';
+import attachZoom from './utils/zoom';
 
-export { Bar, Line, Pie, Radar, Scatter, StackedBar };
+export {
+  Bar, Line, Pie, Radar, Scatter, StackedBar, fitToContainer, measureChart, resolveRefs,
+};
 
 const chartTypes = { Bar, Line, Pie, Radar, Scatter, StackedBar };
 
+setFontUrl(fontDataUrl);
+
 /**
  * AnyWidget render callback.
  *
  * Called by the widget framework whenever the widget needs to be
  * (re-)rendered. Loads the xkcd font, creates a sized container
  * and SVG element, attaches a selection handler, and instantiates
- * the requested chart class.
+ * the requested chart class. Later changes to the config or chart
+ * type redraw the chart in place; a burst of such changes (e.g.
+ * several traitlets updated together from Python) causes a single
+ * redraw on the next animation frame. Changes to the width or height
+ * only resize the container: the SVG follows it by rescaling its
+ * viewBox, without redrawing. Returns a cleanup function that
+ * detaches the model listeners.
  *
  * @param {Object} params
  * @param {Object} params.model - AnyWidget model providing get/set/save_changes.
@@ -34,22 +61,85 @@ const chartTypes = { Bar, Line, Pie, Radar, Scatter, StackedBar };
  */
 async function render({ model, el }) {
   el.innerHTML = "";
-  await loadFont();
-
-  var width = model.get("width");
-  var height = model.get("height");
+  var stats = startStats(model.get("chart_type"));
+  await measureAsync("loadFont", loadFont, stats);
 
   var container = document.createElement("div");
-  container.style.width = width + "px";
-  container.style.height = height + "px";
   el.appendChild(container);
 
   var svg = document.createElementNS("http://www.w3.org/2000/svg", "svg");
   svg.setAttribute("class", "chart");
   container.appendChild(svg);
 
-  var chartType = model.get("chart_type");
-  var config = JSON.parse(model.get("config"));
+  var resize = () => {
+    container.style.width = model.get("width") + "px";
+    container.style.height = model.get("height") + "px";
+  };
+  resize();
+
+  var chart = null;
+  var seq = 0;
+  var redraw = () => {
+    // A full redraw supersedes any window request still in flight.
+    seq += 1;
+    var config = JSON.parse(model.get("config"));
+    chart = draw(model, svg, model.get("chart_type"), config, stats);
+    stats = null;
+  };
+  redraw();
+  var stopFitting = fitToContainer(svg);
+
+  var scheduleRedraw = throttleFrame(redraw);
+  var redrawEvents = ["change:config", "change:chart_type"];
+  var resizeEvents = ["change:width", "change:height"];
+  redrawEvents.forEach((name) => model.on(name, scheduleRedraw));
+  resizeEvents.forEach((name) => model.on(name, resize));
+  var cleanup = () => {
+    scheduleRedraw.cancel();
+    stopFitting();
+    redrawEvents.forEach((name) => model.off(name, scheduleRedraw));
+    resizeEvents.forEach((name) => model.off(name, resize));
+  };
+
+  if (model.get("zoomable")) {
+    // Replies can arrive out of order; only draw the newest one.
+    var requestWindow = throttleFrame((range) => {
+      seq += 1;
+      model.send({ type: "window", seq, x0: range.x0, x1: range.x1, width: chart.width });
+    });
+    attachZoom(svg, {
+      getChart: () => chart,
+      getWindow: () => chart.data.window,
+      onChange: (range) => {
+        chart.data.window = { ...chart.data.window, ...range };
+        requestWindow(range);
+      },
+    });
+    var onWindow = (msg) => {
+      if (msg.type !== "window" || msg.seq !== seq) return;
+      chart = draw(model, svg, model.get("chart_type"), JSON.parse(msg.config));
+    };
+    model.on("msg:custom", onWindow);
+    return () => {
+      cleanup();
+      requestWindow.cancel();
+      model.off("msg:custom", onWindow);
+    };
+  }
+  return cleanup;
+}
+
+/**
+ * Instantiate a chart with a selection callback bound to the model.
+ *
+ * @param {Object} model - AnyWidget model.
+ * @param {SVGElement} svg - Target SVG element.
+ * @param {string} chartType - Name of the chart class.
+ * @param {Object} config - Chart config (title, data, options).
+ * @param {Object} [stats] - Stats already recorded for this draw.
+ * @returns {Object} The chart instance.
+ */
+function draw(model, svg, chartType, config, stats) {
   // Wire up the selection callback.
   // Plain click replaces the selection; shift-click toggles individual
   // items in or out of the current selection array. Box-select on
@@ -74,7 +164,15 @@ async function render({ model, el }) {
     }
     model.save_changes();
   };
-  new chartTypes[chartType](svg, config);
+  var chart = measureChart(chartType, chartTypes[chartType], svg, config, {
+    stats,
+    report: (result) => {
+      model.set("render_stats", JSON.stringify(result));
+      model.save_changes();
+    },
+  });
+  chart.data.window = config.data.window;
+  return chart;
 }
 
 export default { render };
@@ -0,0 +1,42 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import { extentOf, stackedExtentOf, resolveExtent } from '../src/utils/extent';
+
+test('extentOf skips missing values across datasets', () => {
+  const datasets = [{ data: [3, null, -1] }, { data: [undefined, 7, '2'] }];
+  assert.deepEqual(extentOf(datasets), [-1, 7]);
+});
+
+test('extentOf reads values through an accessor', () => {
+  const datasets = [{ data: [{ y: 5 }, { y: 2 }] }, { data: [{ y: 9 }] }];
+  assert.deepEqual(extentOf(datasets, (d) => d.y), [2, 9]);
+});
+
+test('extentOf handles more values than fit in a call', () => {
+  const data = Array.from({ length: 500000 }, (_, i) => i % 1000);
+  assert.deepEqual(extentOf([{ data }]), [0, 999]);
+});
+
+test('empty data has an empty extent', () => {
+  assert.deepEqual(extentOf([]), [Infinity, -Infinity]);
+  assert.deepEqual(extentOf([{ data: [null] }]), [Infinity, -Infinity]);
+  assert.deepEqual(stackedExtentOf([]), [Infinity, -Infinity]);
+});
+
+test('stackedExtentOf uses column totals', () => {
+  const datasets = [{ data: [1, 2, 3] }, { data: [4, -5, 0] }];
+  assert.deepEqual(stackedExtentOf(datasets), [-3, 5]);
+});
+
+test('resolveExtent prefers the precomputed extent', () => {
+  let calls = 0;
+  const compute = () => {
+    calls += 1;
+    return [0, 1];
+  };
+  assert.deepEqual(resolveExtent({ y: [2, 3] }, 'y', compute), [2, 3]);
+  assert.equal(calls, 0);
+  assert.deepEqual(resolveExtent({ y: [2, 3] }, 'x', compute), [0, 1]);
+  assert.deepEqual(resolveExtent(undefined, 'y', compute), [0, 1]);
+  assert.equal(calls, 2);
+});
@@ -0,0 +1,45 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import throttleFrame from '../src/utils/frame';
+import installWindow from './frames';
+
+test('bursts of calls run once per frame with the latest arguments', () => {
+  const frames = installWindow();
+  const calls = [];
+  const throttled = throttleFrame((...args) => calls.push(args));
+  throttled(1);
+  throttled(2, 'b');
+  assert.equal(frames.pending(), 1);
+  frames.flush();
+  assert.deepEqual(calls, [[2, 'b']]);
+  throttled(3);
+  frames.flush();
+  assert.deepEqual(calls, [[2, 'b'], [3]]);
+});
+
+test('cancel drops the waiting call', () => {
+  const frames = installWindow();
+  let calls = 0;
+  const throttled = throttleFrame(() => {
+    calls += 1;
+  });
+  throttled();
+  throttled.cancel();
+  assert.equal(frames.flush(), 0);
+  assert.equal(calls, 0);
+  throttled();
+  frames.flush();
+  assert.equal(calls, 1);
+});
+
+test('timers stand in for animation frames outside the browser', async () => {
+  delete globalThis.window;
+  let calls = 0;
+  const throttled = throttleFrame(() => {
+    calls += 1;
+  });
+  throttled();
+  throttled();
+  await new Promise((resolve) => setTimeout(resolve, 50));
+  assert.equal(calls, 1);
+});
@@ -0,0 +1,31 @@
+/**
+ * Fake browser globals for running the helpers under Node.
+ *
+ * `installWindow` replaces `window` with an object whose animation
+ * frames only run when `flush` is called, so tests can step through
+ * frames one at a time.
+ */
+export default function installWindow(extra = {}) {
+  let queue = new Map();
+  let next = 1;
+  globalThis.window = {
+    requestAnimationFrame(cb) {
+      queue.set(next, cb);
+      next += 1;
+      return next - 1;
+    },
+    cancelAnimationFrame(id) {
+      queue.delete(id);
+    },
+    ...extra,
+  };
+  return {
+    flush() {
+      const callbacks = [...queue.values()];
+      queue = new Map();
+      callbacks.forEach((cb) => cb());
+      return callbacks.length;
+    },
+    pending: () => queue.size,
+  };
+}
@@ -0,0 +1,39 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import nearestIndex from '../src/utils/nearest';
+
+function linearNearest(positions, x) {
+  let best = -1;
+  let bestDistance = Infinity;
+  positions.forEach((position, i) => {
+    const distance = Math.abs(position - x);
+    if (distance < bestDistance) {
+      best = i;
+      bestDistance = distance;
+    }
+  });
+  return best;
+}
+
+test('empty positions have no nearest index', () => {
+  assert.equal(nearestIndex([], 3), -1);
+});
+
+test('positions outside the range snap to the ends', () => {
+  assert.equal(nearestIndex([10, 20, 30], -5), 0);
+  assert.equal(nearestIndex([10, 20, 30], 99), 2);
+  assert.equal(nearestIndex([10], 99), 0);
+});
+
+test('ties go to the earlier position', () => {
+  assert.equal(nearestIndex([10, 20, 30], 15), 0);
+  assert.equal(nearestIndex([10, 20, 30], 25), 1);
+  assert.equal(nearestIndex([10, 20, 20, 30], 20), 1);
+});
+
+test('binary search agrees with a linear scan', () => {
+  const positions = Array.from({ length: 257 }, (_, i) => i * 3.5 + (i % 3));
+  for (let x = -10; x < 950; x += 0.75) {
+    assert.equal(nearestIndex(positions, x), linearNearest(positions, x), `x = ${x}`);
+  }
+});
@@ -0,0 +1,32 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import resolveRefs from '../src/utils/refs';
+
+const registry = { d0: ['a', 'b'], d1: [1, 2] };
+
+test('references are replaced by the shared arrays', () => {
+  const config = {
+    title: 't',
+    data: {
+      labels: { $ref: 'd0' },
+      datasets: [{ label: 'x', data: { $ref: 'd1' } }, { data: [3, 4] }],
+    },
+  };
+  const resolved = resolveRefs(config, registry);
+  assert.equal(resolved.title, 't');
+  assert.equal(resolved.data.labels, registry.d0);
+  assert.equal(resolved.data.datasets[0].data, registry.d1);
+  assert.equal(resolved.data.datasets[0].label, 'x');
+  assert.deepEqual(resolved.data.datasets[1].data, [3, 4]);
+});
+
+test('the config itself is not modified', () => {
+  const config = { data: { datasets: [{ data: { $ref: 'd1' } }] } };
+  resolveRefs(config, registry);
+  assert.deepEqual(config, { data: { datasets: [{ data: { $ref: 'd1' } }] } });
+});
+
+test('configs without labels stay without labels', () => {
+  const resolved = resolveRefs({ data: { datasets: [] } }, registry);
+  assert.equal('labels' in resolved.data, false);
+});
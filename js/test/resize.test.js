@@ -0,0 +1,75 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import fitToContainer from '../src/utils/resize';
+import installWindow from './frames';
+
+function fakeSvg(clientWidth) {
+  const attributes = {};
+  return {
+    attributes,
+    viewBox: { baseVal: { width: 600, height: 400 } },
+    parentElement: { clientWidth },
+    setAttribute(name, value) {
+      attributes[name] = value;
+    },
+  };
+}
+
+test('the SVG is rescaled to its container once per frame', () => {
+  const observers = [];
+  class ResizeObserver {
+    constructor(callback) {
+      this.callback = callback;
+      this.disconnected = false;
+      observers.push(this);
+    }
+
+    observe(target) {
+      this.target = target;
+    }
+
+    disconnect() {
+      this.disconnected = true;
+    }
+  }
+  const frames = installWindow({ ResizeObserver });
+  const svg = fakeSvg(300);
+  const stop = fitToContainer(svg);
+  assert.equal(observers[0].target, svg.parentElement);
+  observers[0].callback();
+  observers[0].callback();
+  assert.equal(frames.flush(), 1);
+  assert.deepEqual(svg.attributes, { width: 300, height: 200 });
+
+  observers[0].callback();
+  stop();
+  assert.equal(frames.pending(), 0);
+  assert.equal(observers[0].disconnected, true);
+});
+
+test('window resizes are followed without ResizeObserver', () => {
+  const listeners = {};
+  const frames = installWindow({
+    addEventListener(name, fn) {
+      listeners[name] = fn;
+    },
+    removeEventListener(name, fn) {
+      if (listeners[name] === fn) delete listeners[name];
+    },
+  });
+  const svg = fakeSvg(150);
+  const stop = fitToContainer(svg);
+  listeners.resize();
+  frames.flush();
+  assert.deepEqual(svg.attributes, { width: 150, height: 100 });
+  stop();
+  assert.equal('resize' in listeners, false);
+});
+
+test('hidden containers are left alone', () => {
+  const frames = installWindow({ addEventListener() {}, removeEventListener() {} });
+  const svg = fakeSvg(0);
+  fitToContainer(svg);
+  frames.flush();
+  assert.deepEqual(svg.attributes, {});
+});
@@ -0,0 +1,59 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import { measure, measureAsync, measureChart, startStats } from '../src/utils/stats';
+import installWindow from './frames';
+
+const svg = { getElementsByTagName: () => [1, 2, 3, 4] };
+
+class FakeChart {
+  constructor(target, config) {
+    this.target = target;
+    this.config = config;
+    measure('setup', () => {});
+  }
+}
+
+function chartEntries() {
+  return performance.getEntries().filter((e) => e.name.startsWith('chart.xkcd'));
+}
+
+test('measureChart reports phases and nodes after the chart is painted', () => {
+  const frames = installWindow({ performance });
+  const reports = [];
+  const chart = measureChart('Line', FakeChart, svg, { title: 't' }, {
+    report: (stats) => reports.push(stats),
+  });
+  assert.equal(chart.config.title, 't');
+  frames.flush();
+  assert.equal(reports.length, 0);
+  frames.flush();
+  assert.equal(reports.length, 1);
+  const [stats] = reports;
+  assert.equal(stats.chartType, 'Line');
+  assert.equal(stats.nodes, 5);
+  assert.deepEqual(Object.keys(stats.phases).sort(), ['construct', 'paint', 'setup']);
+  assert.ok(stats.phases.paint >= stats.phases.construct);
+});
+
+test('performance entries are cleared once recorded', () => {
+  installWindow({ performance });
+  const stats = startStats('Bar');
+  for (let i = 0; i < 5; i += 1) measure('draw', () => {}, stats);
+  assert.equal(chartEntries().length, 0);
+  assert.ok(stats.phases.draw >= 0);
+});
+
+test('measure only records while a chart is being measured', () => {
+  installWindow({ performance });
+  assert.equal(measure('setup', () => 42), 42);
+  assert.equal(chartEntries().length, 0);
+});
+
+test('measureAsync records awaited phases', async () => {
+  installWindow({ performance });
+  const stats = startStats('Pie');
+  const value = await measureAsync('font', async () => 'loaded', stats);
+  assert.equal(value, 'loaded');
+  assert.ok('font' in stats.phases);
+  assert.notEqual(stats.id, startStats('Pie').id);
+});
@@ -3,7 +3,14 @@
 Provides six chart classes (Bar, Line, Pie, Radar, Scatter, StackedBar)
 that mirror the chart.xkcd JavaScript library. Charts can be:
 
-- Rendered as standalone HTML files via ``render()`` / ``to_html()``.
+- Rendered as standalone HTML files via ``render()`` / ``to_html()``,
+  several to a page via ``render_page()`` / ``to_html_page()``,
+  many at once into a zip or tar file via ``render_archive()``,
+  or from asyncio code via ``render_async()`` / ``to_html_async()`` /
+  ``iter_html_async()``.
+- Frozen with ``chart.freeze()`` into immutable, pre-encoded snapshots
+  that can be rendered from many threads at once.
+- Drawn as small multiples, one panel per group of rows, via ``Facet``.
 - Displayed in Jupyter or marimo notebooks via ``to_widget()``.
 
 All chart classes accept a ``title``, ``data`` (labels and datasets),
@@ -18,12 +25,25 @@ try:
 except PackageNotFoundError:
     __version__ = "unknown"
 
+from .archive import render_archive as render_archive
 from .bar import Bar as Bar
 from .line import Line as Line
 from .pie import Pie as Pie
 from .radar import Radar as Radar
 from .scatter import Scatter as Scatter
 from .stacked_bar import StackedBar as StackedBar
+from .charts import FrozenChart as FrozenChart
 from .config import positionType as positionType
-from .renderer import render as render, to_html as to_html
+from .facet import Facet as Facet
+from .renderer import (
+    PageOptions as PageOptions,
+    RenderOptions as RenderOptions,
+    iter_html_async as iter_html_async,
+    render as render,
+    render_async as render_async,
+    render_page as render_page,
+    to_html as to_html,
+    to_html_async as to_html_async,
+    to_html_page as to_html_page,
+)
 from .widget import to_widget as to_widget
@@ -0,0 +1,176 @@
+"""Render many charts straight into a zip or tar archive.
+
+Each chart is rendered and written to its archive entry before the
+next one is rendered, so no intermediate files are created and memory
+use is bounded by the largest single page. Unless pages are told to
+load the JavaScript from elsewhere, the bundle is added to the archive
+once and every page refers to it with a relative URL. The archive is
+written next to its destination under a temporary name and only moved
+into place once every chart has been rendered.
+"""
+
+import contextlib
+import functools
+import io
+import os
+import tarfile
+import tempfile
+import time
+import zipfile
+from collections.abc import Iterable, Mapping
+from pathlib import Path, PurePosixPath
+
+from .bundle import BUNDLE_NAME, load_bundle
+from .renderer import to_html
+
+_ZIP_COMPRESSION = {
+    "stored": zipfile.ZIP_STORED,
+    "deflated": zipfile.ZIP_DEFLATED,
+    "bzip2": zipfile.ZIP_BZIP2,
+    "lzma": zipfile.ZIP_LZMA,
+}
+
+_TAR_OPENERS = {
+    "": tarfile.TarFile.taropen,
+    "gz": tarfile.TarFile.gzopen,
+    "bz2": tarfile.TarFile.bz2open,
+    "xz": tarfile.TarFile.xzopen,
+}
+
+_TAR_SUFFIXES = {
+    ".tar": "",
+    ".tar.gz": "gz",
+    ".tgz": "gz",
+    ".tar.bz2": "bz2",
+    ".tar.xz": "xz",
+}
+
+
+def render_archive(
+    charts: Mapping | Iterable,
+    output_path: Path | str,
+    compression: str | None = None,
+    chart_js_url: str | None = None,
+    width: int = 600,
+    height: int = 400,
+) -> list[str]:
+    """Render charts into a `.zip`, `.tar`, `.tar.gz`, `.tar.bz2` or `.tar.xz` file.
+
+    Args:
+        charts: mapping of entry names (e.g. `"sales/q1"`; `.html` is
+            added) to charts, or an iterable of charts, which are named
+            `chart-0`, `chart-1`, and so on. Generators are consumed
+            one chart at a time.
+        output_path: archive to create; its suffix selects the format.
+        compression: for zip files, one of `"stored"`, `"deflated"`
+            (default), `"bzip2"` or `"lzma"`; for tar files, one of
+            `"gz"`, `"bz2"`, `"xz"` or `"none"` (default: from the suffix).
+        chart_js_url: URL pages load the JavaScript from; if omitted,
+            the bundle is stored in the archive as `chart.xkcd.js`.
+        width: chart width in pixels.
+        height: chart height in pixels.
+
+    Returns:
+        Names of the entries written, in order.
+
+    Raises:
+        ValueError: if a chart name is invalid or names the same entry
+            as another chart; the destination is then left untouched.
+    """
+    output_path = Path(output_path)
+    items = charts.items() if isinstance(charts, Mapping) else _numbered(charts)
+    with _open_archive(output_path, compression) as add:
+        names = {}
+        if chart_js_url is None:
+            add(BUNDLE_NAME, load_bundle().body)
+            names[BUNDLE_NAME] = None
+        for name, chart in items:
+            entry = _entry_name(name)
+            if entry in names:
+                raise ValueError(f"duplicate archive entry {entry!r}")
+            url = chart_js_url
+            if url is None:
+                url = "../" * (len(PurePosixPath(entry).parts) - 1) + BUNDLE_NAME
+            page = to_html(chart, chart_js_url=url, width=width, height=height)
+            add(entry, page.encode("utf-8"))
+            names[entry] = None
+    return list(names)
+
+
+@contextlib.contextmanager
+def _open_archive(path, compression):
+    """Open an archive, yielding a function that adds one entry to it.
+
+    The archive is written to a temporary file in the same directory,
+    which replaces `path` only if the block finishes without an error.
+    """
+    opener, add = _archive_format(path, compression)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    os.close(fd)
+    try:
+        os.chmod(tmp, 0o666 & ~_umask())
+        with opener(tmp) as archive:
+            yield functools.partial(add, archive)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+
+
+def _archive_format(path, compression):
+    """Pick the functions that open an archive and add an entry to it."""
+    name = path.name.lower()
+    if name.endswith(".zip"):
+        method = _ZIP_COMPRESSION.get(compression or "deflated")
+        if method is None:
+            raise ValueError(f"unknown zip compression {compression!r}")
+        opener = functools.partial(zipfile.ZipFile, mode="w", compression=method)
+        return opener, _add_zip
+    for suffix, default in _TAR_SUFFIXES.items():
+        if name.endswith(suffix):
+            method = default if compression is None else compression
+            opener = _TAR_OPENERS.get("" if method == "none" else method)
+            if opener is None:
+                raise ValueError(f"unknown tar compression {compression!r}")
+            return functools.partial(opener, mode="w"), _add_tar
+    raise ValueError(f"{path}: cannot tell archive format from suffix")
+
+
+def _umask():
+    """Return the process umask, which temporary files do not honour."""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def _add_zip(archive, name, data):
+    """Write one zip entry."""
+    info = zipfile.ZipInfo(name, time.localtime()[:6])
+    info.compress_type = archive.compression
+    info.external_attr = 0o644 << 16
+    archive.writestr(info, data)
+
+
+def _add_tar(archive, name, data):
+    """Write one tar entry."""
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = int(time.time())
+    info.mode = 0o644
+    archive.addfile(info, io.BytesIO(data))
+
+
+def _numbered(charts):
+    """Name charts that were not given names."""
+    for i, chart in enumerate(charts):
+        yield f"chart-{i}", chart
+
+
+def _entry_name(name):
+    """Turn a chart name into a safe, relative archive entry name."""
+    path = PurePosixPath(name)
+    if not path.parts or path.is_absolute() or ".." in path.parts:
+        raise ValueError(f"invalid chart name {name!r}")
+    entry = str(path)
+    return entry if entry.endswith(".html") else f"{entry}.html"
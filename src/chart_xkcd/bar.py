@@ -1,7 +1,8 @@
 """Bar chart."""
 
 from typing import Any
-from .charts import _AxisChart, _check_labels_datasets
+from .charts import _AxisChart, _check_labels_datasets, _datasets_extent
+from .sources import labelled_datasets
 
 
 class Bar(_AxisChart):
@@ -55,3 +56,28 @@ class Bar(_AxisChart):
         super().__init__(
             title=title, x_label=x_label, y_label=y_label, data=data, options=options
         )
+
+    def _data_extent(self):
+        """Return the extent of the y-values."""
+        extent = _datasets_extent(self.data["datasets"])
+        return {} if extent is None else {"y": extent}
+
+    @classmethod
+    def from_file(cls, path, *, x, y, max_points=None, **kwargs):
+        """Create a Bar chart from columns of a `.npy`, Arrow or Parquet file.
+
+        Only the named columns are read, from a memory-mapped file.
+
+        Args:
+            path: file to read.
+            x: name of the column of labels.
+            y: name of the column of values.
+            max_points: optional limit on the number of labels; longer
+                series keep each run's minimum and maximum.
+            **kwargs: other constructor arguments (`title`, `options`, ...).
+
+        Returns:
+            A new chart.
+        """
+        labels, datasets = labelled_datasets(path, x=x, y=y, max_points=max_points)
+        return cls(labels=labels, datasets=datasets, **kwargs)
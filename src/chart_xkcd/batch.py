@@ -0,0 +1,241 @@
+"""Render directories of JSON chart specs.
+
+A spec is a JSON object whose `type` names a chart class and whose
+other keys are that class's constructor arguments:
+
+```
+{
+    "type": "Line",
+    "title": "Samples Collected per Week",
+    "x_label": "Week",
+    "y_label": "Count",
+    "labels": ["1", "2", "3"],
+    "datasets": [{"label": "Samples", "data": [3, 5, 4]}],
+    "options": {"showLegend": false}
+}
+```
+
+`render_specs()` renders every `*.json` file below a directory to a
+matching `.html` file, using several worker processes. A manifest in
+the output directory records the hash of each spec and of the page it
+produced, so specs whose content and output are unchanged are skipped.
+"""
+
+import hashlib
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from . import __version__
+from .bar import Bar
+from .bundle import load_bundle
+from .charts import _BaseChart
+from .line import Line
+from .pie import Pie
+from .radar import Radar
+from .renderer import to_html
+from .scatter import Scatter
+from .stacked_bar import StackedBar
+
+CHART_TYPES = {
+    cls.__name__: cls for cls in (Bar, Line, Pie, Radar, Scatter, StackedBar)
+}
+
+MANIFEST_NAME = ".chart_xkcd.json"
+
+
+@dataclass
+class BatchReport:
+    """Outcome of a call to `render_specs()`.
+
+    Attributes:
+        rendered: dict mapping spec names to seconds spent rendering them.
+        skipped: names of specs whose output was already up to date.
+        failed: dict mapping spec names to error messages.
+        elapsed: total wall-clock time in seconds.
+    """
+
+    rendered: dict[str, float] = field(default_factory=dict)
+    skipped: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def summary(self) -> str:
+        """Return a human-readable timing summary."""
+        lines = [
+            (
+                f"rendered {len(self.rendered)}, skipped {len(self.skipped)}, "
+                f"failed {len(self.failed)} in {self.elapsed:.2f}s"
+            )
+        ]
+        if self.rendered:
+            total = sum(self.rendered.values())
+            slowest = max(self.rendered, key=lambda name: self.rendered[name])
+            lines.append(
+                f"render time {total:.2f}s total, "
+                f"{total / len(self.rendered) * 1000:.1f}ms mean, "
+                f"slowest {slowest} ({self.rendered[slowest] * 1000:.1f}ms)"
+            )
+        for name, message in sorted(self.failed.items()):
+            lines.append(f"error: {name}: {message}")
+        return "\n".join(lines)
+
+
+def chart_from_spec(spec: dict) -> _BaseChart:
+    """Create a chart from a spec.
+
+    Args:
+        spec: dict with a `type` key naming the chart class and other
+            keys giving its constructor arguments.
+
+    Returns:
+        The chart.
+    """
+    if not isinstance(spec, dict):
+        raise TypeError("chart spec must be a JSON object")
+    params = dict(spec)
+    chart_type = params.pop("type", None)
+    if chart_type not in CHART_TYPES:
+        raise ValueError(
+            f"unknown chart type {chart_type!r}: expected one of "
+            f"{', '.join(sorted(CHART_TYPES))}"
+        )
+    return CHART_TYPES[chart_type](**params)
+
+
+def render_specs(
+    spec_dir: Path | str,
+    out_dir: Path | str,
+    chart_js_url: str,
+    jobs: int | None = None,
+    width: int = 600,
+    height: int = 400,
+    force: bool = False,
+    inline: bool = False,
+) -> BatchReport:
+    """Render every `*.json` spec below a directory to HTML.
+
+    Output files mirror the layout of `spec_dir`, with `.json`
+    replaced by `.html`.
+
+    Args:
+        spec_dir: directory containing spec files.
+        out_dir: directory to write HTML files to.
+        chart_js_url: URL to load the chart.xkcd JavaScript module from.
+        jobs: number of worker processes (default: one per CPU).
+        width: chart width in pixels.
+        height: chart height in pixels.
+        force: render every spec even if its output is up to date.
+        inline: embed the JavaScript bundle in every page instead of
+            loading it from `chart_js_url`.
+
+    Returns:
+        A report of what was rendered, skipped, and failed.
+    """
+    start = time.perf_counter()
+    spec_dir = Path(spec_dir)
+    out_dir = Path(out_dir)
+    if not spec_dir.is_dir():
+        raise FileNotFoundError(f"spec directory {spec_dir} does not exist")
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest_path = out_dir / MANIFEST_NAME
+    previous = {} if force else _read_manifest(manifest_path)
+    manifest = {}
+    settings = f"{__version__}:{chart_js_url}:{width}x{height}"
+    if inline:
+        settings += f":{load_bundle().digest}"
+
+    report = BatchReport()
+    todo = []
+    for spec_path in sorted(spec_dir.rglob("*.json")):
+        name = spec_path.relative_to(spec_dir).with_suffix("").as_posix()
+        out_path = out_dir / f"{name}.html"
+        key = _hash(settings.encode("utf-8") + b"\0" + spec_path.read_bytes())
+        entry = previous.get(name)
+        if (
+            isinstance(entry, dict)
+            and entry.get("spec") == key
+            and entry.get("output") == _output_hash(out_path)
+        ):
+            report.skipped.append(name)
+            manifest[name] = entry
+        else:
+            todo.append((name, key, spec_path, out_path))
+
+    args = [
+        (spec, out, chart_js_url, width, height, inline) for _, _, spec, out in todo
+    ]
+    # The manifest is rebuilt from the specs found above, so entries for
+    # deleted specs are dropped, and it is written even if rendering is
+    # interrupted, so finished work is not repeated.
+    try:
+        if jobs == 1 or len(todo) <= 1:
+            _collect(todo, (_render_one(*a) for a in args), report, manifest)
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                results = pool.map(_render_one, *zip(*args))
+                _collect(todo, results, report, manifest)
+    finally:
+        manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def _collect(todo, results, report, manifest):
+    """Record results in the report and manifest as they arrive."""
+    for (name, key, _, _), (output, seconds, error) in zip(todo, results):
+        if error is None:
+            report.rendered[name] = seconds
+            manifest[name] = {"spec": key, "output": output}
+        else:
+            report.failed[name] = error
+
+
+def _render_one(spec_path, out_path, chart_js_url, width, height, inline):
+    """Render one spec file (runs in a worker process).
+
+    Returns a tuple of (output hash, seconds, error message or None).
+    Any error raised by a spec is reported rather than raised, so that
+    one bad spec cannot stop the rest of the batch.
+    """
+    start = time.perf_counter()
+    try:
+        chart = chart_from_spec(json.loads(spec_path.read_text()))
+        text = to_html(
+            chart,
+            chart_js_url=chart_js_url,
+            width=width,
+            height=height,
+            inline=inline,
+        )
+        data = text.encode("utf-8")
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_bytes(data)
+    except Exception as exc:  # noqa: BLE001 - report any bad spec
+        return None, time.perf_counter() - start, f"{type(exc).__name__}: {exc}"
+    return _hash(data), time.perf_counter() - start, None
+
+
+def _read_manifest(path):
+    """Load the manifest of previously rendered specs, if any."""
+    try:
+        manifest = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _output_hash(path):
+    """Hash an existing output file (None if it is missing)."""
+    try:
+        return _hash(path.read_bytes())
+    except OSError:
+        return None
+
+
+def _hash(data):
+    """Return the hex SHA-256 digest of some bytes."""
+    return hashlib.sha256(data).hexdigest()
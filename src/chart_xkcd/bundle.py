@@ -0,0 +1,81 @@
+"""Cached access to the bundled chart.xkcd JavaScript.
+
+The bundle is read from the package's resources once per process and
+kept in memory together with its digest and compressed variants, so
+that inline rendering and the local server never re-read or
+re-compress it.
+"""
+
+import functools
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass
+from importlib.resources import files
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BUNDLE_NAME = "chart.xkcd.js"
+
+MODULES_DIR = "modules"
+
+FONT_NAME = "xkcd-script.ttf"
+
+
+@dataclass(frozen=True)
+class Bundle:
+    """The bundled JavaScript and values derived from it.
+
+    Attributes:
+        text: source of the ES module.
+        body: the source encoded as UTF-8.
+        digest: hex SHA-256 digest of the source.
+        compressed: dict mapping content encodings (`gzip`, and `br`
+            if the `brotli` package is installed) to compressed bytes.
+        literal: the source as a JavaScript string literal that is
+            safe to embed in an HTML `<script>` element.
+    """
+
+    text: str
+    body: bytes
+    digest: str
+    compressed: dict[str, bytes]
+    literal: str
+
+
+@functools.cache
+def load_bundle() -> Bundle:
+    """Load the bundled JavaScript, reading it at most once per process.
+
+    Returns:
+        The cached bundle.
+
+    Raises:
+        FileNotFoundError: if the package was installed without the
+            built JavaScript.
+    """
+    source = files("chart_xkcd").joinpath("static", BUNDLE_NAME)
+    if not source.is_file():
+        raise FileNotFoundError(
+            f"{BUNDLE_NAME} is not bundled with this installation of chart_xkcd"
+        )
+    body = source.read_bytes()
+    compressed = {"gzip": gzip.compress(body, mtime=0)}
+    if brotli is not None:
+        compressed["br"] = brotli.compress(body)
+    text = body.decode("utf-8")
+    return Bundle(
+        text=text,
+        body=body,
+        digest=hashlib.sha256(body).hexdigest(),
+        compressed=compressed,
+        literal=_script_literal(text),
+    )
+
+
+def _script_literal(text):
+    """Quote text as a JS string that cannot close its `<script>` element."""
+    return json.dumps(text).replace("</", "<\\/").replace("<!--", "<\\!--")
@@ -1,17 +1,36 @@
 """Chart classes mirroring the chart.xkcd JS API."""
 
+import hashlib
+import json
+import math
+import numbers
+from dataclasses import dataclass
+
+from .encoder import encode
+
 
 class _BaseChart:
     """Base class for all chart types.
 
     Subclasses (Bar, Pie, Radar, etc.) set ``self.data`` to the
-    appropriate shape and optionally accept ``options``.
+    appropriate shape and optionally accept ``options``. Subclasses
+    whose JS class scales its axes to the data override
+    ``_data_extent``, which is called once, after validation, to
+    fill in ``self.extent`` (a dict mapping axis names to
+    ``[min, max]``). Extents given in ``data["extent"]`` take
+    precedence over computed ones.
     """
 
     def __init__(self, *, title=None, data, options=None):
         self.title = title
         self.data = data
         self.options = options
+        self.extent = {**self._data_extent(), **data.get("extent", {})}
+
+    @property
+    def chart_type(self):
+        """Name of the JS chart class that draws this chart."""
+        return type(self).__name__
 
     def to_dict(self):
         """Serialize the chart to a dict suitable for JSON encoding.
@@ -22,11 +41,74 @@ class _BaseChart:
         config = {}
         if self.title is not None:
             config["title"] = self.title
-        config["data"] = self.data
+        data = self.data
+        if self.extent:
+            data = {**data, "extent": self.extent}
+        config["data"] = data
         if self.options:
             config["options"] = self.options
         return config
 
+    def _data_extent(self):
+        """Return a dict mapping axis names to the data's extent on them."""
+        return {}
+
+    def digest(self):
+        """Return a hex digest identifying the chart's type and content.
+
+        Two charts with the same type and the same serialized config
+        have the same digest, so it can be used as a cache key or ETag.
+        """
+        payload = encode([self.chart_type, self.to_dict()], sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def freeze(self):
+        """Return an immutable snapshot of the chart.
+
+        The chart's data and options are encoded once, so later changes
+        to them do not affect the snapshot, and rendering the snapshot
+        needs neither copying nor re-encoding.
+        """
+        return FrozenChart(
+            chart_type=self.chart_type,
+            title=self.title,
+            payload=encode(self.to_dict(), indent=True),
+            fingerprint=self.digest(),
+        )
+
+
+@dataclass(frozen=True)
+class FrozenChart:
+    """An immutable, pre-encoded snapshot of a chart made by `freeze()`.
+
+    It can be passed to the renderers, the server and `to_widget()`
+    wherever a chart can, and shared between threads without locks,
+    since it holds nothing but strings.
+
+    Attributes:
+        chart_type: name of the JS chart class.
+        title: chart title.
+        payload: the chart's config encoded as (indented) JSON.
+        fingerprint: the chart's digest.
+    """
+
+    chart_type: str
+    title: str | None
+    payload: str
+    fingerprint: str
+
+    def to_dict(self):
+        """Decode a fresh copy of the chart's config."""
+        return json.loads(self.payload)
+
+    def digest(self):
+        """Return the digest of the chart the snapshot was made from."""
+        return self.fingerprint
+
+    def freeze(self):
+        """Return the snapshot itself, which is already immutable."""
+        return self
+
 
 class _AxisChart(_BaseChart):
     """Base class for charts with x/y axis labels (Bar, StackedBar, Line, Scatter).
@@ -65,3 +147,67 @@ def _check_labels_datasets(labels, datasets, chart_name):
                 f"{chart_name}: datasets[{i}] has {len(ds['data'])} values "
                 f"but there are {len(labels)} labels"
             )
+
+
+def _extent(values):
+    """Return ``[min, max]`` of some values, or None if they have no numeric extent.
+
+    Arrays with ``min()``/``max()`` methods (such as NumPy arrays) are
+    reduced with one vectorized call each, ignoring NaN; other
+    sequences use the built-in ``min``/``max``, skipping ``None``
+    (missing) and NaN values. Empty, non-comparable, textual or
+    non-finite values have no extent, in which case the JS side
+    computes it instead.
+    """
+    if len(values) == 0:
+        return None
+    try:
+        if getattr(values, "dtype", None) is not None and values.dtype.kind == "f":
+            import numpy as np
+
+            present = values[~np.isnan(values)]
+            low, high = present.min(), present.max()
+        elif hasattr(values, "min") and hasattr(values, "max"):
+            low, high = values.min(), values.max()
+        else:
+            present = [v for v in values if not _missing(v)]
+            low, high = min(present), max(present)
+    except (TypeError, ValueError):
+        return None
+    for value in (low, high):
+        if isinstance(value, str):
+            return None
+        if isinstance(value, numbers.Real) and not math.isfinite(value):
+            return None
+    return [low, high]
+
+
+def _missing(value):
+    """Is a value None or NaN?"""
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _merge_extents(extents):
+    """Combine several extents into one (None if any is missing)."""
+    extents = list(extents)
+    if not extents or any(e is None for e in extents):
+        return None
+    return [min(e[0] for e in extents), max(e[1] for e in extents)]
+
+
+def _datasets_extent(datasets):
+    """Return the extent of the values in all datasets."""
+    return _merge_extents(_extent(ds["data"]) for ds in datasets)
+
+
+def _stacked_extent(datasets):
+    """Return the extent of the column totals of stacked datasets."""
+    columns = [ds["data"] for ds in datasets]
+    try:
+        if all(hasattr(c, "dtype") for c in columns):
+            totals = sum(columns[1:], columns[0])
+        else:
+            totals = [sum(column) for column in zip(*columns)]
+    except (TypeError, ValueError):
+        return None
+    return _extent(totals)
@@ -0,0 +1,162 @@
+"""JSON encoding of chart configs.
+
+All chart configs pass through `encode()`, whether they are embedded
+in HTML pages or sent to the notebook widget. Besides the types the
+standard library's `json` module handles, it accepts:
+
+- NumPy (or pandas) arrays and scalars, converted in bulk with
+  `tolist()`. `datetime64` values become epoch milliseconds.
+- `array.array` and `memoryview` buffers, also converted in bulk.
+- `datetime.datetime` and `datetime.date`, converted to epoch
+  milliseconds (naive values are taken to be UTC). These can be used
+  directly as Scatter x-values with the `timeFormat` option.
+- `decimal.Decimal`, converted to `float`.
+
+NumPy is never imported: values are recognized by their attributes.
+If `orjson` is installed it is used automatically; otherwise the
+standard library is used. Either way, NaN and infinite floats are
+written as `null`, since `JSON.parse` rejects anything else. Other
+types can be supported with `register()`.
+"""
+
+import array
+import datetime
+import decimal
+import json
+import math
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+_MILLISECOND = datetime.timedelta(milliseconds=1)
+
+_CONVERTERS: dict[type, Callable[[Any], Any]] = {}
+
+_BACKENDS = ("auto", "json", "orjson")
+_backend = "auto"
+
+
+def encode(obj: Any, *, indent: bool = False, sort_keys: bool = False) -> str:
+    """Encode a value as JSON text.
+
+    Args:
+        obj: value to encode.
+        indent: indent nested values by two spaces.
+        sort_keys: sort the keys of objects.
+
+    Returns:
+        JSON as text.
+    """
+    if orjson is not None and _use_orjson():
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=_default, option=option).decode("utf-8")
+    indent_by = 2 if indent else None
+    try:
+        return json.dumps(
+            obj,
+            default=_default,
+            indent=indent_by,
+            sort_keys=sort_keys,
+            allow_nan=False,
+        )
+    except ValueError as exc:
+        # Only values with NaN or infinities pay for the extra pass;
+        # other errors (such as circular references) are passed on.
+        if not str(exc).startswith("Out of range float values"):
+            raise
+        return json.dumps(
+            _finite(obj),
+            default=lambda value: _finite(_default(value)),
+            indent=indent_by,
+            sort_keys=sort_keys,
+        )
+
+
+def register(cls: type, converter: Callable[[Any], Any]) -> None:
+    """Teach the encoder how to handle another type.
+
+    Args:
+        cls: type to handle (subclasses are handled too).
+        converter: function turning an instance of `cls` into a value
+            the encoder already understands.
+    """
+    _CONVERTERS[cls] = converter
+
+
+def set_backend(name: str) -> None:
+    """Choose the JSON library used by `encode()`.
+
+    Args:
+        name: `"orjson"`, `"json"` (the standard library), or `"auto"`
+            (orjson if it is installed, otherwise the standard library).
+    """
+    if name not in _BACKENDS:
+        raise ValueError(f"backend must be one of {', '.join(_BACKENDS)}")
+    if name == "orjson" and orjson is None:
+        raise ImportError("the orjson backend requires the orjson package")
+    global _backend
+    _backend = name
+
+
+def epoch_ms(value: datetime.date) -> int:
+    """Convert a date or datetime to milliseconds since the Unix epoch.
+
+    Naive datetimes are taken to be UTC; dates are taken to be midnight UTC.
+
+    Args:
+        value: date or datetime to convert.
+
+    Returns:
+        Milliseconds since 1970-01-01T00:00:00Z.
+    """
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.UTC)
+        return (value - _EPOCH) // _MILLISECOND
+    return (value - _EPOCH.date()) // _MILLISECOND
+
+
+def _use_orjson():
+    """Decide whether to encode with orjson."""
+    if _backend == "auto":
+        return orjson is not None
+    return _backend == "orjson"
+
+
+def _finite(obj):
+    """Copy lists and dicts, replacing NaN and infinite floats with None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def _default(obj):
+    """Convert a value the JSON libraries do not handle themselves."""
+    for cls in type(obj).__mro__:
+        if cls in _CONVERTERS:
+            return _CONVERTERS[cls](obj)
+    if isinstance(obj, datetime.date):
+        return epoch_ms(obj)
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, (array.array, memoryview)):
+        return obj.tolist()
+    dtype = getattr(obj, "dtype", None)
+    if dtype is not None and hasattr(obj, "tolist"):
+        if getattr(dtype, "kind", None) == "M":
+            obj = obj.astype("datetime64[ms]").astype("int64")
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
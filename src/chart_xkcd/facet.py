@@ -0,0 +1,186 @@
+"""Small multiples: one chart per group of rows, laid out in a grid."""
+
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from .charts import _merge_extents
+from .renderer import render_page, to_html_page
+from .scatter import Scatter
+
+
+class Facet:
+    """A grid of charts of one type, one for each value of a column.
+
+    The rows are split into groups in a single pass. With `share_y`
+    (and, for Scatter, `share_x`) the axis domain is computed once
+    for all panels and sent with each one, so every panel uses the
+    same scale and none has to compute its own in the browser.
+
+    Args:
+        chart_cls: chart class to draw each panel with (`Line`, `Bar`,
+            `StackedBar`, `Radar` or `Scatter`).
+        data: rows as an iterable of dicts, or columns as a dict of
+            equal-length sequences.
+        by: name of the column whose values split the rows into panels.
+        x: name of the column of labels (x-values for Scatter).
+        y: name of the column of values, or a list of names (one
+            dataset each; Scatter takes a single name).
+        ncols: number of panels per row.
+        share_y: give every panel the same y-axis domain.
+        share_x: give every Scatter panel the same x-axis domain.
+        **kwargs: other constructor arguments for every panel
+            (`x_label`, `y_label`, `options`, ...).
+
+    Example:
+
+    ```
+    Facet(
+        Line,
+        [{"site": "A", "week": 1, "count": 3}, ...],
+        by="site",
+        x="week",
+        y="count",
+        ncols=6,
+    ).render("sites.html", chart_js_url="chart.xkcd.js")
+    ```
+    """
+
+    def __init__(
+        self,
+        chart_cls: type,
+        data: Any,
+        *,
+        by: str,
+        x: str,
+        y: str | list[str],
+        ncols: int = 6,
+        share_y: bool = True,
+        share_x: bool = False,
+        **kwargs: Any,
+    ):
+        if ncols <= 0:
+            raise ValueError("Facet: ncols must be positive")
+        y_names = [y] if isinstance(y, str) else list(y)
+        if chart_cls is Scatter and len(y_names) != 1:
+            raise ValueError("Facet: Scatter panels take a single y column")
+        self.chart_cls = chart_cls
+        self.ncols = ncols
+
+        groups = {}
+        for row in _rows(data, [by, x, *y_names]):
+            xs, ys = groups.setdefault(row[by], ([], [[] for _ in y_names]))
+            xs.append(row[x])
+            for column, name in zip(ys, y_names):
+                column.append(row[name])
+
+        self.keys = list(groups)
+        self.charts = [
+            self._panel(key, xs, ys, y_names, kwargs)
+            for key, (xs, ys) in groups.items()
+        ]
+        if share_y:
+            self._share("y")
+        if share_x and chart_cls is Scatter:
+            self._share("x")
+
+    def to_html(
+        self,
+        chart_js_url: str | None = None,
+        width: int = 300,
+        height: int = 200,
+        title: str | None = None,
+        **options,
+    ) -> str:
+        """Return HTML for a page showing all the panels.
+
+        Args:
+            chart_js_url: URL to load the chart.xkcd JavaScript module from.
+            width: width of each panel in pixels.
+            height: height of each panel in pixels.
+            title: page title.
+            **options: any of the `PageOptions`; `lazy` defaults to True.
+
+        Returns:
+            HTML as text.
+        """
+        options.setdefault("lazy", True)
+        return to_html_page(
+            self.charts,
+            chart_js_url=chart_js_url,
+            width=width,
+            height=height,
+            title=title,
+            columns=self.ncols,
+            **options,
+        )
+
+    def render(
+        self,
+        output_path: Path | str,
+        chart_js_url: str | None = None,
+        width: int = 300,
+        height: int = 200,
+        title: str | None = None,
+        **options,
+    ) -> None:
+        """Render all the panels to a single HTML file.
+
+        Args:
+            output_path: where to write result.
+            chart_js_url: URL to load the chart.xkcd JavaScript module from.
+            width: width of each panel in pixels.
+            height: height of each panel in pixels.
+            title: page title.
+            **options: any of the `PageOptions`; `lazy` defaults to True.
+        """
+        options.setdefault("lazy", True)
+        render_page(
+            self.charts,
+            output_path,
+            chart_js_url=chart_js_url,
+            width=width,
+            height=height,
+            title=title,
+            columns=self.ncols,
+            **options,
+        )
+
+    def _panel(self, key, xs, ys, y_names, kwargs):
+        """Build the chart for one group."""
+        kwargs = {"title": str(key), **kwargs}
+        if self.chart_cls is Scatter:
+            points = [{"x": a, "y": b} for a, b in zip(xs, ys[0])]
+            return Scatter(datasets=[{"data": points}], **kwargs)
+        datasets = [
+            {"label": name, "data": column} for name, column in zip(y_names, ys)
+        ]
+        return self.chart_cls(labels=xs, datasets=datasets, **kwargs)
+
+    def _share(self, axis):
+        """Give every panel the union of the panels' extents on an axis.
+
+        Panels without an extent (e.g. with no numeric values) are left
+        out of the union but still get the shared extent.
+        """
+        extents = [c.extent.get(axis) for c in self.charts]
+        shared = _merge_extents(e for e in extents if e is not None)
+        if shared is None:
+            return
+        for chart in self.charts:
+            chart.extent[axis] = shared
+
+
+def _rows(data, names):
+    """Iterate over rows given as dicts or as a dict of columns."""
+    if isinstance(data, Mapping):
+        missing = [name for name in names if name not in data]
+        if missing:
+            raise ValueError(f"Facet: no column(s) named {', '.join(missing)}")
+        columns = [data[name] for name in names]
+        for values in zip(*columns, strict=True):
+            yield dict(zip(names, values))
+    elif isinstance(data, Iterable):
+        yield from data
+    else:
+        raise TypeError("Facet: data must be rows or a dict of columns")
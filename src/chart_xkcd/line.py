@@ -1,7 +1,9 @@
 """Line chart."""
 
 from typing import Any
-from .charts import _AxisChart, _check_labels_datasets
+from .charts import _AxisChart, _check_labels_datasets, _datasets_extent
+from .resample import fill_gaps, format_bucket, interval_ms, label_format, resample
+from .sources import labelled_datasets
 
 
 class Line(_AxisChart):
@@ -58,3 +60,62 @@ class Line(_AxisChart):
         super().__init__(
             title=title, x_label=x_label, y_label=y_label, data=data, options=options
         )
+
+    def _data_extent(self):
+        """Return the extent of the y-values."""
+        extent = _datasets_extent(self.data["datasets"])
+        return {} if extent is None else {"y": extent}
+
+    @classmethod
+    def from_file(cls, path, *, x, y, max_points=None, **kwargs):
+        """Create a Line chart from columns of a `.npy`, Arrow or Parquet file.
+
+        Only the named columns are read, from a memory-mapped file.
+
+        Args:
+            path: file to read.
+            x: name of the column of labels.
+            y: name of a column of values, or a list of names (one line each).
+            max_points: optional limit on the number of labels; longer
+                series keep each run's minimum and maximum.
+            **kwargs: other constructor arguments (`title`, `options`, ...).
+
+        Returns:
+            A new chart.
+        """
+        labels, datasets = labelled_datasets(path, x=x, y=y, max_points=max_points)
+        return cls(labels=labels, datasets=datasets, **kwargs)
+
+    @classmethod
+    def from_events(
+        cls, ts, values, *, every, agg="mean", series=None, fmt=None, **kwargs
+    ):
+        """Create a Line chart by bucketing timestamped events.
+
+        Empty buckets between the first and last event are included,
+        so that the labels are evenly spaced in time.
+
+        Args:
+            ts: event timestamps (datetimes, dates, `datetime64` values
+                or epoch milliseconds).
+            values: event values.
+            every: bucket width, e.g. `"5min"` (see `resample.resample`).
+            agg: aggregation applied to each bucket (`"mean"`, `"sum"`,
+                `"count"`, `"min"`, `"max"`, `"first"` or `"last"`).
+            series: optional per-event series names, one line each.
+            fmt: `strftime` format for the labels (UTC); by default
+                the coarsest one that tells buckets apart.
+            **kwargs: other constructor arguments (`title`, `options`, ...).
+
+        Returns:
+            A new chart.
+        """
+        buckets, columns = resample(ts, values, every=every, agg=agg, series=series)
+        buckets, columns = fill_gaps(buckets, columns, every=every, agg=agg)
+        fmt = fmt or label_format(interval_ms(every))
+        datasets = [
+            {"data": column} if key is None else {"label": str(key), "data": column}
+            for key, column in columns.items()
+        ]
+        labels = [format_bucket(b, fmt) for b in buckets]
+        return cls(labels=labels, datasets=datasets, **kwargs)
@@ -2,25 +2,103 @@
 
 import argparse
 import shutil
+import sys
 from importlib.resources import as_file, files
 from pathlib import Path
 
 
 def main():
     """Entry point for command-line driver."""
-    args = _parse_args()
+    parser = _make_parser()
+    args = parser.parse_args()
+    if args.command == "serve":
+        _serve(args)
+    elif args.command == "render":
+        _render(args)
+    elif args.out is not None:
+        _extract(args)
+    else:
+        parser.error("either --out or a command is required")
+
+
+def _extract(args):
+    """Copy the bundled JavaScript file to the requested path."""
     source = files("chart_xkcd") / "static" / "chart.xkcd.js"
     with as_file(source) as src_path:
         shutil.copy2(src_path, Path(args.out))
 
 
-def _parse_args():
-    """Parse command-line arguments."""
+def _serve(args):
+    """Serve the bundled JavaScript and a directory of rendered charts."""
+    from .server import ChartApp, serve
+
+    serve(ChartApp(directory=args.directory), host=args.host, port=args.port)
+
+
+def _render(args):
+    """Render a directory of chart specs and print a timing summary."""
+    from .batch import render_specs
+
+    report = render_specs(
+        args.specs,
+        args.out_dir,
+        chart_js_url=args.chart_js_url,
+        jobs=args.jobs,
+        width=args.width,
+        height=args.height,
+        force=args.force,
+        inline=args.inline,
+    )
+    print(report.summary())
+    if report.failed:
+        sys.exit(1)
+
+
+def _make_parser():
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
-        description="Extract the bundled chart.xkcd JavaScript file."
+        description="Extract the bundled chart.xkcd JavaScript file, "
+        "render chart specs, or serve charts."
+    )
+    parser.add_argument("--out", help="output path for the .js file")
+    commands = parser.add_subparsers(dest="command")
+
+    serve = commands.add_parser(
+        "serve", help="serve the JavaScript bundle and rendered charts locally"
+    )
+    serve.add_argument(
+        "directory", nargs="?", default=".", help="directory of .html files to serve"
+    )
+    serve.add_argument("--host", default="127.0.0.1", help="interface to listen on")
+    serve.add_argument("--port", type=int, default=8000, help="port to listen on")
+
+    render = commands.add_parser(
+        "render", help="render a directory of JSON chart specs"
+    )
+    render.add_argument("specs", help="directory of .json chart specs")
+    render.add_argument("--out-dir", required=True, help="directory for .html files")
+    render.add_argument(
+        "-j", "--jobs", type=int, default=None, help="number of worker processes"
     )
-    parser.add_argument("--out", required=True, help="output path for the .js file")
-    return parser.parse_args()
+    render.add_argument(
+        "--chart-js-url",
+        default="chart.xkcd.js",
+        help="URL pages load the chart.xkcd JavaScript module from",
+    )
+    render.add_argument("--width", type=int, default=600, help="chart width in pixels")
+    render.add_argument(
+        "--height", type=int, default=400, help="chart height in pixels"
+    )
+    render.add_argument(
+        "--inline",
+        action="store_true",
+        help="embed the JavaScript bundle in each page",
+    )
+    render.add_argument(
+        "--force", action="store_true", help="re-render specs that are up to date"
+    )
+
+    return parser
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 """Radar chart."""
 
 from typing import Any
-from .charts import _BaseChart, _check_labels_datasets
+from .charts import _BaseChart, _check_labels_datasets, _datasets_extent
 
 
 class Radar(_BaseChart):
@@ -57,3 +57,8 @@ class Radar(_BaseChart):
         _check_labels_datasets(labels, datasets, "Radar")
         data = {"labels": list(labels), "datasets": list(datasets)}
         super().__init__(title=title, data=data, options=options)
+
+    def _data_extent(self):
+        """Return the extent of the y-values."""
+        extent = _datasets_extent(self.data["datasets"])
+        return {} if extent is None else {"y": extent}
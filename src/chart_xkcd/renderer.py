@@ -1,11 +1,19 @@
 """HTML renderer for chart.xkcd charts."""
 
-import json
+import asyncio
+import functools
+import html
+from collections import Counter
+from collections.abc import AsyncIterator, Iterable
+from concurrent.futures import Executor
+from dataclasses import dataclass
 from pathlib import Path
 
-from .charts import _BaseChart
+from .bundle import FONT_NAME, load_bundle
+from .charts import FrozenChart, _BaseChart
+from .encoder import encode
 
-_TEMPLATE = """\
+_HEAD = """\
 <!DOCTYPE html>
 <html>
 <head>
@@ -13,24 +21,155 @@ _TEMPLATE = """\
 <title>{title}</title>
 </head>
 <body>
-<div style="width:{width}px;height:{height}px;margin:0 auto;">
+<div style="{size}margin:0 auto;">
 <svg class="chart"></svg>
 </div>
 <script type="module">
-import {{ {chart_type} }} from '{chart_js_url}';
+{imports}
 var svg = document.querySelector('.chart');
-new {chart_type}(svg, {config});
+{construct}svg, """
+
+_TAIL = """);
+{fit}</script>
+</body>
+</html>
+"""
+
+_PAGE_HEAD = """\
+<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+</head>
+<body>
+<div style="{layout}">
+{panels}
+</div>
+{shared}<script type="module">
+{imports}
+"""
+
+_PAGE_PANEL = """\
+<div style="{size}">
+<svg class="chart" id="chart-{index}"></svg>
+</div>"""
+
+_PAGE_CHART = "{construct}document.getElementById('chart-{index}'), {config});\n"
+
+_PAGE_LAZY_CHART = """\
+pending.set('chart-{index}', () => {construct}
+  document.getElementById('chart-{index}'), {config}));
+"""
+
+_PAGE_LAZY_TAIL = """\
+const observer = new IntersectionObserver((entries) => {
+  for (const entry of entries) {
+    if (!entry.isIntersecting) continue;
+    observer.unobserve(entry.target);
+    pending.get(entry.target.id)();
+    pending.delete(entry.target.id);
+  }
+}, { rootMargin: '200px' });
+for (const id of pending.keys()) observer.observe(document.getElementById(id));
+"""
+
+_PAGE_SHARED = """\
+<script type="application/json" id="chart-data">{registry}</script>
+"""
+
+_PAGE_SHARED_LOAD = (
+    "const shared = JSON.parse(document.getElementById('chart-data').textContent);\n"
+)
+
+_FIXED_SIZE = "width:{width}px;height:{height}px;"
+
+_RESPONSIVE_SIZE = "width:100%;max-width:{width}px;"
+
+_RESPONSIVE_PANEL = "flex:1 1 {width}px;max-width:{width}px;"
+
+_RESPONSIVE_CELL = "width:100%;"
+
+_FIT = "fitToContainer(svg);\n"
+
+_NEW = "new {chart_type}("
+
+_MEASURED = "measureChart('{chart_type}', {chart_type}, "
+
+_PAGE_FIT = "document.querySelectorAll('svg.chart').forEach(fitToContainer);\n"
+
+_PAGE_FLEX = "display:flex;flex-wrap:wrap;justify-content:center;"
+
+_PAGE_GRID = (
+    "display:grid;grid-template-columns:repeat({columns},{track});"
+    "justify-content:center;"
+)
+
+_PAGE_TAIL = """\
 </script>
 </body>
 </html>
 """
 
+_IMPORT_URL = "import {{ {names} }} from '{chart_js_url}';"
+
+_IMPORT_INLINE = """\
+const {{ {names} }} = await import(URL.createObjectURL(
+  new Blob([{source}], {{ type: 'text/javascript' }})));"""
+
+_IMPORT_MODULE = "import {name} from '{modules_url}/{name}.js';"
+
+_IMPORT_MODULES = """\
+import {{ {core} }} from '{modules_url}/core.js';
+{modules}
+setFontUrl('{modules_url}/{font}');"""
+
+_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class RenderOptions:
+    """Options accepted as keyword arguments by all the renderers.
+
+    Attributes:
+        inline: embed the JavaScript bundle in the page instead of
+            loading it from `chart_js_url`.
+        modules_url: URL of a directory holding the code-split build;
+            if given, the page imports only the chart modules it uses
+            (plus the shared core) and loads the font as a separate file.
+        responsive: let charts shrink with the page, up to `width`,
+            rescaling the drawing rather than redrawing it.
+        stats: log how long each chart took to draw and paint (and how
+            many SVG elements it has) to the browser console.
+    """
+
+    inline: bool = False
+    modules_url: str | None = None
+    responsive: bool = False
+    stats: bool = False
+
+
+@dataclass(frozen=True)
+class PageOptions(RenderOptions):
+    """Options accepted by the page renderers, besides `RenderOptions`.
+
+    Attributes:
+        lazy: draw each chart only when its panel is scrolled near the
+            viewport, so long pages open as quickly as short ones.
+        share_data: write labels and dataset values that appear in more
+            than one chart to the page once and reference them by ID.
+    """
+
+    lazy: bool = False
+    share_data: bool = False
+
 
 def to_html(
     chart: _BaseChart,
-    chart_js_url: str,
+    chart_js_url: str | None = None,
     width: int = 600,
     height: int = 400,
+    **options,
 ) -> str:
     """Return HTML for a chart as a string.
 
@@ -39,28 +178,25 @@ def to_html(
         chart_js_url: URL to load the chart.xkcd JavaScript module from.
         width: chart width in pixels.
         height: chart height in pixels.
+        **options: any of the `RenderOptions`.
 
     Returns:
         HTML as text.
     """
-    chart_type = type(chart).__name__
-    config = json.dumps(chart.to_dict(), indent=2)
-    return _TEMPLATE.format(
-        title=chart.title or "",
-        chart_js_url=chart_js_url,
-        width=width,
-        height=height,
-        chart_type=chart_type,
-        config=config,
+    opts = RenderOptions(**options)
+    head = _head(
+        chart, chart_js_url=chart_js_url, width=width, height=height, opts=opts
     )
+    return head + _encode(chart) + _tail(opts)
 
 
 def render(
     chart: _BaseChart,
     output_path: Path | str,
-    chart_js_url: str,
+    chart_js_url: str | None = None,
     width: int = 600,
     height: int = 400,
+    **options,
 ) -> None:
     """Render a chart to an HTML file.
 
@@ -70,7 +206,346 @@ def render(
         chart_js_url: URL to load the chart.xkcd JavaScript module from.
         width: chart width in pixels.
         height: chart height in pixels.
+        **options: any of the `RenderOptions`.
     """
     Path(output_path).write_text(
-        to_html(chart, chart_js_url=chart_js_url, width=width, height=height)
+        to_html(
+            chart, chart_js_url=chart_js_url, width=width, height=height, **options
+        ),
+        encoding="utf-8",
     )
+
+
+def to_html_page(
+    charts: Iterable[_BaseChart],
+    chart_js_url: str | None = None,
+    width: int = 600,
+    height: int = 400,
+    title: str | None = None,
+    columns: int | None = None,
+    **options,
+) -> str:
+    """Return HTML for a page showing several charts.
+
+    The page loads (or embeds) the JavaScript bundle once and imports
+    each chart class once, however many charts use it.
+
+    Args:
+        charts: charts to show, in order.
+        chart_js_url: URL to load the chart.xkcd JavaScript module from.
+        width: width of each chart in pixels.
+        height: height of each chart in pixels.
+        title: page title.
+        columns: lay the charts out in a grid with this many columns
+            (default: wrap them to fit the window).
+        **options: any of the `PageOptions`.
+
+    Returns:
+        HTML as text.
+    """
+    opts = PageOptions(**options)
+    charts = list(charts)
+    shared = ""
+    if opts.share_data:
+        configs, registry = _share_data([chart.to_dict() for chart in charts])
+        shared = _PAGE_SHARED.format(registry=registry.replace("</", "<\\/"))
+    if columns is None:
+        layout = _PAGE_FLEX
+    elif columns > 0:
+        track = f"minmax(0,{width}px)" if opts.responsive else f"{width}px"
+        layout = _PAGE_GRID.format(columns=columns, track=track)
+    else:
+        raise ValueError("columns must be positive")
+    if not opts.responsive:
+        size = _FIXED_SIZE.format(width=width, height=height)
+    elif columns is None:
+        size = _RESPONSIVE_PANEL.format(width=width)
+    else:
+        # Grid tracks already cap the width; the panel just fills its cell.
+        size = _RESPONSIVE_CELL
+    panels = "\n".join(
+        _PAGE_PANEL.format(size=size, index=i) for i in range(len(charts))
+    )
+    helpers = ["resolveRefs"] if opts.share_data else []
+    parts = [
+        _PAGE_HEAD.format(
+            title=html.escape(title or ""),
+            layout=layout,
+            panels=panels,
+            shared=shared,
+            imports=_imports(
+                [c.chart_type for c in charts], chart_js_url, opts, helpers=helpers
+            ),
+        )
+    ]
+    if opts.share_data:
+        parts.append(_PAGE_SHARED_LOAD)
+    template = _PAGE_CHART
+    if opts.lazy:
+        parts.append("const pending = new Map();\n")
+        template = _PAGE_LAZY_CHART
+    for i, chart in enumerate(charts):
+        if opts.share_data:
+            text = f"resolveRefs({encode(configs[i], indent=True)}, shared)"
+        else:
+            text = _encode(chart)
+        construct = _construct(chart.chart_type, opts)
+        if opts.lazy:
+            construct = construct.rstrip()
+        parts.append(template.format(construct=construct, index=i, config=text))
+    if opts.lazy:
+        parts.append(_PAGE_LAZY_TAIL)
+    if opts.responsive:
+        parts.append(_PAGE_FIT)
+    parts.append(_PAGE_TAIL)
+    return "".join(parts)
+
+
+def render_page(
+    charts: Iterable[_BaseChart],
+    output_path: Path | str,
+    chart_js_url: str | None = None,
+    width: int = 600,
+    height: int = 400,
+    title: str | None = None,
+    columns: int | None = None,
+    **options,
+) -> None:
+    """Render several charts to a single HTML file.
+
+    Args:
+        charts: charts to show, in order.
+        output_path: where to write result.
+        chart_js_url: URL to load the chart.xkcd JavaScript module from.
+        width: width of each chart in pixels.
+        height: height of each chart in pixels.
+        title: page title.
+        columns: lay the charts out in a grid with this many columns
+            (default: wrap them to fit the window).
+        **options: any of the `PageOptions`.
+    """
+    Path(output_path).write_text(
+        to_html_page(
+            charts,
+            chart_js_url=chart_js_url,
+            width=width,
+            height=height,
+            title=title,
+            columns=columns,
+            **options,
+        ),
+        encoding="utf-8",
+    )
+
+
+async def to_html_async(
+    chart: _BaseChart,
+    chart_js_url: str | None = None,
+    width: int = 600,
+    height: int = 400,
+    executor: Executor | None = None,
+    **options,
+) -> str:
+    """Return HTML for a chart without blocking the event loop.
+
+    Encoding runs in `executor`, so large charts do not stall other
+    requests being served by the same loop.
+
+    Args:
+        chart: chart to convert.
+        chart_js_url: URL to load the chart.xkcd JavaScript module from.
+        width: chart width in pixels.
+        height: chart height in pixels.
+        executor: executor to encode in (default: the loop's default executor).
+        **options: any of the `RenderOptions`.
+
+    Returns:
+        HTML as text.
+    """
+    RenderOptions(**options)  # fail here rather than in the executor
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor,
+        functools.partial(
+            to_html,
+            chart,
+            chart_js_url=chart_js_url,
+            width=width,
+            height=height,
+            **options,
+        ),
+    )
+
+
+async def render_async(
+    chart: _BaseChart,
+    output_path: Path | str,
+    chart_js_url: str | None = None,
+    width: int = 600,
+    height: int = 400,
+    executor: Executor | None = None,
+    **options,
+) -> None:
+    """Render a chart to an HTML file without blocking the event loop.
+
+    Both encoding and the file write run in `executor`.
+
+    Args:
+        chart: chart to render.
+        output_path: where to write result.
+        chart_js_url: URL to load the chart.xkcd JavaScript module from.
+        width: chart width in pixels.
+        height: chart height in pixels.
+        executor: executor to work in (default: the loop's default executor).
+        **options: any of the `RenderOptions`.
+    """
+    text = await to_html_async(
+        chart,
+        chart_js_url=chart_js_url,
+        width=width,
+        height=height,
+        executor=executor,
+        **options,
+    )
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        executor,
+        functools.partial(Path(output_path).write_text, text, encoding="utf-8"),
+    )
+
+
+async def iter_html_async(
+    chart: _BaseChart,
+    chart_js_url: str | None = None,
+    width: int = 600,
+    height: int = 400,
+    executor: Executor | None = None,
+    chunk_size: int = _CHUNK_SIZE,
+    **options,
+) -> AsyncIterator[str]:
+    """Yield HTML for a chart in chunks suitable for a streaming response.
+
+    The document head is yielded before the chart is encoded so that
+    clients start receiving bytes immediately. The encoded chart is
+    then yielded in pieces of at most `chunk_size` characters.
+
+    Args:
+        chart: chart to convert.
+        chart_js_url: URL to load the chart.xkcd JavaScript module from.
+        width: chart width in pixels.
+        height: chart height in pixels.
+        executor: executor to encode in (default: the loop's default executor).
+        chunk_size: maximum number of characters per chunk.
+        **options: any of the `RenderOptions`.
+
+    Yields:
+        Successive pieces of the HTML document.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    opts = RenderOptions(**options)
+    yield _head(chart, chart_js_url=chart_js_url, width=width, height=height, opts=opts)
+    loop = asyncio.get_running_loop()
+    config = await loop.run_in_executor(executor, _encode, chart)
+    for start in range(0, len(config), chunk_size):
+        yield config[start : start + chunk_size]
+    yield _tail(opts)
+
+
+def _head(chart, *, chart_js_url, width, height, opts):
+    """Fill in the part of the page that precedes the chart config."""
+    chart_type = chart.chart_type
+    size = _RESPONSIVE_SIZE if opts.responsive else _FIXED_SIZE
+    return _HEAD.format(
+        title=chart.title or "",
+        imports=_imports([chart_type], chart_js_url, opts),
+        size=size.format(width=width, height=height),
+        construct=_construct(chart_type, opts),
+    )
+
+
+def _construct(chart_type, opts):
+    """Return the start of the expression that draws a chart."""
+    return (_MEASURED if opts.stats else _NEW).format(chart_type=chart_type)
+
+
+def _tail(opts):
+    """Return the part of the page that follows the chart config."""
+    return _TAIL.format(fit=_FIT if opts.responsive else "")
+
+
+def _imports(chart_types, chart_js_url, opts, helpers=()):
+    """Build the statement that brings chart classes (and helpers) into the page."""
+    helpers: list[str] = [*helpers]
+    if opts.responsive:
+        helpers.append("fitToContainer")
+    if opts.stats:
+        helpers.append("measureChart")
+    if opts.modules_url is not None:
+        if opts.inline:
+            raise ValueError("inline and modules_url cannot be combined")
+        base = opts.modules_url.rstrip("/")
+        modules = "\n".join(
+            _IMPORT_MODULE.format(name=name, modules_url=base)
+            for name in sorted(set(chart_types))
+        )
+        return _IMPORT_MODULES.format(
+            core=", ".join(["setFontUrl", *helpers]),
+            modules=modules,
+            modules_url=base,
+            font=FONT_NAME,
+        )
+    names = ", ".join(sorted(set(chart_types)) + helpers)
+    if opts.inline:
+        return _IMPORT_INLINE.format(names=names, source=load_bundle().literal)
+    if chart_js_url is None:
+        raise ValueError("chart_js_url is required unless inline=True")
+    return _IMPORT_URL.format(names=names, chart_js_url=chart_js_url)
+
+
+def _share_data(configs):
+    """Replace arrays used more than once with references to shared copies.
+
+    Labels and dataset values are compared by their JSON encoding. The
+    configs are copied rather than modified.
+
+    Returns:
+        Tuple of (new configs, JSON object text mapping IDs to arrays).
+    """
+    texts = {}
+
+    def key(value):
+        if id(value) not in texts:
+            texts[id(value)] = (encode(value), value)
+        return texts[id(value)][0]
+
+    counts = Counter()
+    for config in configs:
+        data = config["data"]
+        if "labels" in data:
+            counts[key(data["labels"])] += 1
+        for ds in data["datasets"]:
+            counts[key(ds["data"])] += 1
+    repeated = [text for text, n in counts.items() if n > 1]
+    ids = {text: f"d{i}" for i, text in enumerate(repeated)}
+
+    def ref(value):
+        text = key(value)
+        return {"$ref": ids[text]} if text in ids else value
+
+    result = []
+    for config in configs:
+        data = dict(config["data"])
+        if "labels" in data:
+            data["labels"] = ref(data["labels"])
+        data["datasets"] = [{**ds, "data": ref(ds["data"])} for ds in data["datasets"]]
+        result.append({**config, "data": data})
+    registry = ",".join(f'"{ident}":{text}' for text, ident in ids.items())
+    return result, "{" + registry + "}"
+
+
+def _encode(chart):
+    """Encode a chart's config as it appears in the page."""
+    if isinstance(chart, FrozenChart):
+        return chart.payload
+    return encode(chart.to_dict(), indent=True)
@@ -0,0 +1,249 @@
+"""Bucket timestamped events into regular intervals.
+
+`resample` turns raw `(timestamp, value)` events into one aggregated
+value per interval, per series. Timestamps may be datetimes, dates,
+`datetime64` values or numbers of epoch milliseconds; buckets are
+always reported as epoch milliseconds (UTC), which the JavaScript
+charts use directly without parsing dates.
+
+NumPy arrays are bucketed with vectorized operations; any other
+iterables are bucketed in a single streaming pass that keeps only
+one accumulator per bucket.
+"""
+
+import datetime
+import numbers
+import re
+
+from .encoder import epoch_ms
+
+AGGREGATIONS = ("mean", "sum", "count", "min", "max", "first", "last")
+
+_UNITS = {
+    "ms": 1,
+    "s": 1000,
+    "min": 60 * 1000,
+    "h": 60 * 60 * 1000,
+    "d": 24 * 60 * 60 * 1000,
+    "w": 7 * 24 * 60 * 60 * 1000,
+}
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+
+_INTERVAL = re.compile(r"^\s*(\d+)?\s*(ms|s|min|h|d|w)\s*$")
+
+
+def resample(ts, values, *, every, agg="mean", series=None):
+    """Aggregate events into regular time buckets.
+
+    Args:
+        ts: event timestamps.
+        values: event values (ignored by `count`).
+        every: bucket width, either a number of milliseconds or a
+            string such as `"500ms"`, `"30s"`, `"5min"`, `"1h"`, `"1d"`
+            or `"1w"`.
+        agg: one of `AGGREGATIONS`.
+        series: optional per-event series names; each series is
+            aggregated separately.
+
+    Returns:
+        Tuple of (bucket starts in epoch milliseconds, dict mapping
+        each series name to its aggregated values). Only buckets that
+        some series occupies are listed (see `fill_gaps`); a series
+        with no events in one of them holds None. Without `series`,
+        the dict has the single key None.
+    """
+    step = interval_ms(every)
+    if agg not in AGGREGATIONS:
+        raise ValueError(f"agg must be one of {', '.join(AGGREGATIONS)}")
+    if _is_array(ts) and _is_array(values) and (series is None or _is_array(series)):
+        found = _vectorized(ts, values, series, step, agg)
+    else:
+        found = _streaming(ts, values, series, step, agg)
+
+    buckets = sorted({b for table in found.values() for b in table})
+    return buckets, {
+        key: [table.get(b) for b in buckets] for key, table in found.items()
+    }
+
+
+def fill_gaps(buckets, columns, *, every, agg="mean"):
+    """Add the empty buckets between the occupied ones returned by `resample`.
+
+    Args:
+        buckets: bucket starts in epoch milliseconds, in order.
+        columns: dict mapping series names to their aggregated values.
+        every: the bucket width given to `resample`.
+        agg: the aggregation given to `resample`.
+
+    Returns:
+        Tuple of (buckets, columns) running from the first to the last
+        bucket with no gaps; buckets where a series has no events hold
+        0 for `count` and `sum` and None otherwise.
+    """
+    if not buckets:
+        return buckets, columns
+    step = interval_ms(every)
+    full = list(range(buckets[0], buckets[-1] + step, step))
+    empty = _empty(agg)
+    filled = {}
+    for key, column in columns.items():
+        known = {b: v for b, v in zip(buckets, column) if v is not None}
+        filled[key] = [known.get(b, empty) for b in full]
+    return full, filled
+
+
+def interval_ms(every):
+    """Convert a bucket width to milliseconds.
+
+    Args:
+        every: number of milliseconds or a string such as `"5min"`.
+
+    Returns:
+        Positive integer number of milliseconds.
+    """
+    if isinstance(every, str):
+        match = _INTERVAL.match(every)
+        if match is None:
+            raise ValueError(f"cannot understand interval {every!r}")
+        step = int(match.group(1) or 1) * _UNITS[match.group(2)]
+    elif isinstance(every, datetime.timedelta):
+        step = every // datetime.timedelta(milliseconds=1)
+    else:
+        step = int(every)
+    if step <= 0:
+        raise ValueError("interval must be positive")
+    return step
+
+
+def label_format(step):
+    """Choose a `strftime` format that distinguishes buckets of a given width."""
+    if step % _UNITS["d"] == 0:
+        return "%Y-%m-%d"
+    if step % _UNITS["min"] == 0:
+        return "%Y-%m-%d %H:%M"
+    if step % _UNITS["s"] == 0:
+        return "%Y-%m-%d %H:%M:%S"
+    return "%Y-%m-%d %H:%M:%S.%f"
+
+
+def format_bucket(ms, fmt):
+    """Format a bucket start (epoch milliseconds) as UTC text.
+
+    `%f` is written as three digits of milliseconds rather than
+    six of microseconds.
+    """
+    moment = _EPOCH + datetime.timedelta(milliseconds=ms)
+    if "%f" in fmt:
+        fmt = fmt.replace("%f", f"{moment.microsecond // 1000:03d}")
+    return moment.strftime(fmt)
+
+
+def _empty(agg):
+    """Value of a bucket with no events for an aggregation."""
+    return 0 if agg in ("count", "sum") else None
+
+
+def _streaming(ts, values, series, step, agg):
+    """Aggregate any iterables in one pass."""
+    keys = iter(series) if series is not None else None
+    tables = {}
+    for t, value in zip(ts, values, strict=True):
+        key = next(keys) if keys is not None else None
+        table = tables.setdefault(key, {})
+        ms = _timestamp_ms(t)
+        bucket = int(ms // step * step)
+        acc = table.get(bucket)
+        if acc is None:
+            table[bucket] = [value, 1]
+        elif agg in ("mean", "sum"):
+            acc[0] += value
+            acc[1] += 1
+        elif agg == "count":
+            acc[1] += 1
+        elif agg == "min":
+            acc[0] = min(acc[0], value)
+        elif agg == "max":
+            acc[0] = max(acc[0], value)
+        elif agg == "last":
+            acc[0] = value
+    return {
+        key: {bucket: _finish(acc, agg) for bucket, acc in table.items()}
+        for key, table in tables.items()
+    }
+
+
+def _timestamp_ms(t):
+    """Convert one timestamp (number, date, datetime or datetime64) to epoch ms."""
+    if isinstance(t, numbers.Real):
+        return t
+    dtype = getattr(t, "dtype", None)
+    if dtype is not None and dtype.kind == "M":
+        return int(t.astype("datetime64[ms]").astype("int64"))
+    return epoch_ms(t)
+
+
+def _finish(acc, agg):
+    """Turn a streaming accumulator into its aggregated value."""
+    total, count = acc
+    if agg == "mean":
+        return total / count
+    if agg == "count":
+        return count
+    return total
+
+
+def _vectorized(ts, values, series, step, agg):
+    """Aggregate NumPy arrays without a Python-level loop over events."""
+    import numpy as np
+
+    ts = np.asarray(ts)
+    if ts.dtype.kind == "M":
+        ts = ts.astype("datetime64[ms]").astype(np.int64)
+    buckets = ts // step * step
+    values = np.asarray(values)
+    if series is None:
+        groups = [(None, slice(None))]
+    else:
+        names, codes = np.unique(np.asarray(series), return_inverse=True)
+        groups = [(key, codes == i) for i, key in enumerate(names.tolist())]
+
+    found = {}
+    for key, selector in groups:
+        starts, where = np.unique(buckets[selector], return_inverse=True)
+        found[key] = dict(
+            zip(
+                starts.astype(np.int64).tolist(),
+                _reduce(np, values[selector], where, len(starts), agg).tolist(),
+            )
+        )
+    return found
+
+
+def _reduce(np, values, where, size, agg):
+    """Apply an aggregation to the values falling in each bucket."""
+    if agg == "count":
+        return np.bincount(where, minlength=size)
+    if agg in ("sum", "mean"):
+        totals = np.bincount(where, weights=values, minlength=size)
+        if agg == "sum":
+            return totals
+        return totals / np.bincount(where, minlength=size)
+    positions = np.arange(len(values))
+    if agg == "last":
+        chosen = np.full(size, -1)
+        np.maximum.at(chosen, where, positions)
+        return values[chosen]
+    chosen = np.full(size, len(values))
+    np.minimum.at(chosen, where, positions)
+    result = values[chosen]
+    if agg == "min":
+        np.minimum.at(result, where, values)
+    elif agg == "max":
+        np.maximum.at(result, where, values)
+    return result
+
+
+def _is_array(obj):
+    """Is an object a NumPy (or NumPy-like) array?"""
+    return hasattr(obj, "dtype") and hasattr(obj, "shape")
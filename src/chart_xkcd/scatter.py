@@ -1,7 +1,9 @@
 """Scatter plot."""
 
 from typing import Any
-from .charts import _AxisChart
+from .charts import _AxisChart, _extent, _merge_extents
+from .resample import resample
+from .sources import scatter_datasets
 
 
 class Scatter(_AxisChart):
@@ -74,3 +76,75 @@ class Scatter(_AxisChart):
         super().__init__(
             title=title, x_label=x_label, y_label=y_label, data=data, options=options
         )
+
+    def _data_extent(self):
+        """Return the extents of the x- and y-values."""
+        extent = {}
+        for axis in ("x", "y"):
+            axis_extent = _merge_extents(
+                _extent([pt[axis] for pt in ds["data"]]) for ds in self.data["datasets"]
+            )
+            if axis_extent is not None:
+                extent[axis] = axis_extent
+        return extent
+
+    @classmethod
+    def from_file(cls, path, *, x, y, series=None, max_points=None, **kwargs):
+        """Create a Scatter chart from columns of a `.npy`, Arrow or Parquet file.
+
+        Only the named columns are read, from a memory-mapped file.
+
+        Args:
+            path: file to read.
+            x: name of the column of x-values.
+            y: name of the column of y-values.
+            series: optional name of a column whose values split the
+                points into one dataset each.
+            max_points: optional limit on the number of points per dataset.
+            **kwargs: other constructor arguments (`title`, `options`, ...).
+
+        Returns:
+            A new chart.
+        """
+        datasets = scatter_datasets(
+            path, x=x, y=y, series=series, max_points=max_points
+        )
+        return cls(datasets=datasets, **kwargs)
+
+    @classmethod
+    def from_events(
+        cls, ts, values, *, every, agg="mean", series=None, options=None, **kwargs
+    ):
+        """Create a Scatter chart by bucketing timestamped events.
+
+        Each non-empty bucket becomes a point whose x-value is the start
+        of the bucket in epoch milliseconds, so the browser does not
+        parse any dates. Unless `options` sets one, the `timeFormat`
+        option is set so that x-values are shown as times.
+
+        Args:
+            ts: event timestamps (datetimes, dates, `datetime64` values
+                or epoch milliseconds).
+            values: event values.
+            every: bucket width, e.g. `"5min"` (see `resample.resample`).
+            agg: aggregation applied to each bucket (`"mean"`, `"sum"`,
+                `"count"`, `"min"`, `"max"`, `"first"` or `"last"`).
+            series: optional per-event series names, one dataset each.
+            options: dict of chart options.
+            **kwargs: other constructor arguments (`title`, `x_label`, ...).
+
+        Returns:
+            A new chart.
+        """
+        buckets, columns = resample(ts, values, every=every, agg=agg, series=series)
+        datasets = []
+        for key, column in columns.items():
+            points = [
+                {"x": b, "y": v} for b, v in zip(buckets, column) if v is not None
+            ]
+            dataset = {"data": points}
+            if key is not None:
+                dataset["label"] = str(key)
+            datasets.append(dataset)
+        options = {"timeFormat": "YYYY-MM-DD HH:mm", **(options or {})}
+        return cls(datasets=datasets, options=options, **kwargs)
@@ -0,0 +1,360 @@
+"""Local HTTP server for the chart.xkcd bundle and rendered charts.
+
+`ChartApp` is a plain WSGI application that also exposes an ASGI
+entry point as `ChartApp.asgi`, so it can be mounted in an existing
+web framework or exercised directly with a test client. `serve()`
+runs it with the standard library's `wsgiref` server.
+
+The bundled JavaScript is served under a content-hashed name with
+`Cache-Control: immutable`, with gzip (and brotli, if the `brotli`
+package is installed) variants compressed once at startup. Files
+from the code-split build (per-chart modules, their shared chunks
+and the font) are served from `/static/modules/` and compressed
+once, when first requested. Charts are served with ETags derived
+from their digest so that unchanged charts are answered with
+`304 Not Modified`.
+"""
+
+import gzip
+import hashlib
+import html
+import re
+from dataclasses import dataclass, field
+from importlib.resources import files
+from pathlib import Path
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIServer, make_server
+
+from .bundle import BUNDLE_NAME, MODULES_DIR, load_bundle
+from .charts import _BaseChart
+from .renderer import to_html
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+_IMMUTABLE = "public, max-age=31536000, immutable"
+_REVALIDATE = "no-cache"
+_JS_TYPE = "text/javascript; charset=utf-8"
+_HTML_TYPE = "text/html; charset=utf-8"
+_MODULE_TYPES = {".js": _JS_TYPE, ".ttf": "font/ttf"}
+_COMPRESS_MIN_SIZE = 1024
+
+# An entity tag, optionally weak; its opaque part may contain commas.
+_ETAG = re.compile(r'(?:W/)?("[^"]*")')
+
+_INDEX = """\
+<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>chart.xkcd</title>
+</head>
+<body>
+<ul>
+{items}
+</ul>
+</body>
+</html>
+"""
+
+_STATUS = {
+    200: "200 OK",
+    304: "304 Not Modified",
+    404: "404 Not Found",
+    405: "405 Method Not Allowed",
+}
+
+
+@dataclass
+class _Asset:
+    """A response body with its headers and precompressed variants."""
+
+    body: bytes
+    content_type: str
+    etag: str
+    cache_control: str
+    encoded: dict[str, bytes] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, body, content_type, cache_control, etag=None):
+        """Create an asset, compressing the body once if it is worth it.
+
+        The ETag defaults to the SHA-256 digest of the body.
+        """
+        if etag is None:
+            etag = hashlib.sha256(body).hexdigest()
+        asset = cls(body, content_type, etag, cache_control)
+        if len(body) >= _COMPRESS_MIN_SIZE:
+            if brotli is not None:
+                asset.encoded["br"] = brotli.compress(body)
+            asset.encoded["gzip"] = gzip.compress(body, mtime=0)
+        return asset
+
+
+class ChartApp:
+    """WSGI/ASGI application serving the JS bundle and rendered charts.
+
+    Routes:
+
+    - `/static/chart.xkcd.<hash>.js`: the bundle, cached as immutable.
+    - `/static/chart.xkcd.js`: the bundle, revalidated with its ETag.
+    - `/static/modules/<name>`: a file from the code-split build;
+      content-hashed chunks in `chunks/` are cached as immutable,
+      other files are revalidated with their ETags.
+    - `/<name>.html`: a chart added with `add_chart()`, or an HTML
+      file from `directory`.
+    - `/`: an index page linking to every chart.
+
+    Args:
+        charts: optional mapping of names to charts to serve.
+        directory: optional directory of pre-rendered HTML files.
+        width: width in pixels of charts rendered by the app.
+        height: height in pixels of charts rendered by the app.
+    """
+
+    def __init__(self, charts=None, directory=None, width=600, height=400):
+        self.width = width
+        self.height = height
+        self.directory = Path(directory) if directory is not None else None
+        self._charts = {}
+        self._modules = {}
+        self._bundle = _load_bundle()
+        for name, chart in (charts or {}).items():
+            self.add_chart(name, chart)
+
+    @property
+    def bundle_url(self):
+        """URL path of the content-hashed bundle (None if it is not built)."""
+        if self._bundle is None:
+            return None
+        return f"/static/chart.xkcd.{self._bundle.etag[:12]}.js"
+
+    def add_chart(self, name: str, chart: _BaseChart) -> None:
+        """Render a chart and serve it as `/<name>.html`.
+
+        Args:
+            name: name of the chart in URLs.
+            chart: chart to serve.
+        """
+        chart_js_url = self.bundle_url or f"/static/{BUNDLE_NAME}"
+        text = to_html(
+            chart, chart_js_url=chart_js_url, width=self.width, height=self.height
+        )
+        etag = hashlib.sha256(
+            f"{chart.digest()}:{chart_js_url}:{self.width}x{self.height}".encode()
+        ).hexdigest()
+        self._charts[name] = _Asset.build(
+            text.encode("utf-8"), _HTML_TYPE, _REVALIDATE, etag=etag
+        )
+
+    def __call__(self, environ, start_response):
+        """WSGI entry point."""
+        status, headers, body = self.respond(
+            environ.get("REQUEST_METHOD", "GET"),
+            environ.get("PATH_INFO", "/"),
+            {
+                "accept-encoding": environ.get("HTTP_ACCEPT_ENCODING", ""),
+                "if-none-match": environ.get("HTTP_IF_NONE_MATCH", ""),
+            },
+        )
+        start_response(_STATUS[status], headers)
+        return [body]
+
+    async def asgi(self, scope, receive, send):
+        """ASGI entry point."""
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        request_headers = {
+            key.decode("latin-1").lower(): value.decode("latin-1")
+            for key, value in scope.get("headers", [])
+        }
+        status, headers, body = self.respond(
+            scope.get("method", "GET"), scope.get("path", "/"), request_headers
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (key.encode("latin-1"), value.encode("latin-1"))
+                    for key, value in headers
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    def respond(self, method, path, request_headers):
+        """Build a response for a request.
+
+        Args:
+            method: HTTP method.
+            path: request path.
+            request_headers: dict of lower-case request header names to values.
+
+        Returns:
+            Tuple of (status code, list of header pairs, body bytes).
+        """
+        if method not in ("GET", "HEAD"):
+            return 405, [("Allow", "GET, HEAD"), ("Content-Length", "0")], b""
+        asset = self._lookup(path)
+        if asset is None:
+            body = b"not found"
+            headers = [("Content-Type", "text/plain"), ("Content-Length", "9")]
+            return 404, headers, body
+
+        etag = f'"{asset.etag}"'
+        headers = [
+            ("ETag", etag),
+            ("Cache-Control", asset.cache_control),
+            ("Vary", "Accept-Encoding"),
+        ]
+        if _none_match(request_headers.get("if-none-match", ""), etag):
+            return 304, headers, b""
+
+        body = asset.body
+        encoding = _choose_encoding(
+            request_headers.get("accept-encoding", ""), asset.encoded
+        )
+        if encoding is not None:
+            body = asset.encoded[encoding]
+            headers.append(("Content-Encoding", encoding))
+        headers.append(("Content-Type", asset.content_type))
+        headers.append(("Content-Length", str(len(body))))
+        return 200, headers, (b"" if method == "HEAD" else body)
+
+    def _lookup(self, path):
+        """Find the asset for a request path."""
+        if path in ("/", "/index.html"):
+            return self._index()
+        if self._bundle is not None:
+            if path == self.bundle_url:
+                return self._bundle
+            if path == f"/static/{BUNDLE_NAME}":
+                return _Asset(
+                    self._bundle.body,
+                    self._bundle.content_type,
+                    self._bundle.etag,
+                    _REVALIDATE,
+                    self._bundle.encoded,
+                )
+        if path.startswith(f"/static/{MODULES_DIR}/"):
+            return self._module(path[len(f"/static/{MODULES_DIR}/") :])
+        if not path.endswith(".html"):
+            return None
+        name = path.lstrip("/")[: -len(".html")]
+        if name in self._charts:
+            return self._charts[name]
+        return self._from_directory(name)
+
+    def _module(self, name):
+        """Load (once) a file from the code-split build."""
+        if name in self._modules:
+            return self._modules[name]
+        parts = name.split("/")
+        if len(parts) > 2 or (len(parts) == 2 and parts[0] != "chunks"):
+            return None
+        content_type = _MODULE_TYPES.get(Path(name).suffix)
+        if content_type is None or not all(_is_plain_name(p) for p in parts):
+            return None
+        source = files("chart_xkcd").joinpath("static", MODULES_DIR, *parts)
+        if not source.is_file():
+            return None
+        cache_control = _IMMUTABLE if parts[0] == "chunks" else _REVALIDATE
+        asset = _Asset.build(source.read_bytes(), content_type, cache_control)
+        self._modules[name] = asset
+        return asset
+
+    def _from_directory(self, name):
+        """Load a pre-rendered HTML file from the served directory."""
+        if self.directory is None or not _is_plain_name(name):
+            return None
+        candidate = self.directory / f"{name}.html"
+        if not candidate.is_file():
+            return None
+        return _Asset.build(candidate.read_bytes(), _HTML_TYPE, _REVALIDATE)
+
+    def _index(self):
+        """Build an index page linking to every chart."""
+        names = set(self._charts)
+        if self.directory is not None and self.directory.is_dir():
+            names.update(
+                p.stem for p in self.directory.glob("*.html") if p.stem != "index"
+            )
+        items = "\n".join(
+            f'<li><a href="{html.escape(n)}.html">{html.escape(n)}</a></li>'
+            for n in sorted(names)
+        )
+        page = _INDEX.format(items=items)
+        return _Asset.build(page.encode("utf-8"), _HTML_TYPE, _REVALIDATE)
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    """WSGI server that handles each request in its own thread."""
+
+    daemon_threads = True
+
+
+def serve(app: ChartApp, host: str = "127.0.0.1", port: int = 8000) -> None:
+    """Serve an app until interrupted.
+
+    Args:
+        app: application to serve.
+        host: interface to listen on.
+        port: port to listen on.
+    """
+    with make_server(host, port, app, server_class=_ThreadingWSGIServer) as server:
+        print(f"serving on http://{host}:{port}/")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def _load_bundle():
+    """Wrap the cached bundle as an asset (None if it is not built)."""
+    try:
+        bundle = load_bundle()
+    except FileNotFoundError:
+        return None
+    return _Asset(bundle.body, _JS_TYPE, bundle.digest, _IMMUTABLE, bundle.compressed)
+
+
+def _is_plain_name(name):
+    """Check that a requested name cannot escape the served directory."""
+    if not name or name.startswith("."):
+        return False
+    return "/" not in name and "\\" not in name
+
+
+def _none_match(header, etag):
+    """Tell whether an If-None-Match header matches an entity tag.
+
+    As in RFC 9110 section 13.1.2, `*` matches any representation,
+    and otherwise each listed tag is compared weakly, ignoring `W/`.
+    """
+    header = header.strip()
+    if header == "*":
+        return True
+    return any(match[1] == etag for match in _ETAG.finditer(header))
+
+
+def _choose_encoding(header, available):
+    """Pick the best content encoding the client accepts."""
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(coding.strip().lower())
+    for encoding in ("br", "gzip"):
+        if encoding in available and (encoding in accepted or "*" in accepted):
+            return encoding
+    return None
@@ -0,0 +1,320 @@
+"""Read chart data from columnar files without loading them into Python objects.
+
+Supported formats, chosen by file suffix:
+
+- `.npy`: NumPy structured arrays, memory-mapped with `numpy.load`.
+- `.arrow`, `.feather`, `.ipc`: Arrow IPC files, memory-mapped with
+  `pyarrow.memory_map` and read one record batch at a time.
+- `.parquet`: Parquet files, read with `pyarrow.parquet` (memory-mapped
+  where the filesystem allows it) one batch of rows at a time.
+
+Only the columns a chart refers to are read, a batch of rows at a
+time. When a chart is downsampled, each batch is reduced as soon as
+it is read, so memory use is bounded by the size of the output (plus
+one batch) rather than the input. Values stay in NumPy buffers, and
+only the points that end up in the chart are converted to Python
+objects. NumPy (and pyarrow for Arrow and Parquet) are optional
+dependencies that are imported only when these functions are called.
+"""
+
+from pathlib import Path
+
+from .resample import format_bucket, interval_ms, label_format
+
+_ARROW_SUFFIXES = (".arrow", ".feather", ".ipc")
+
+_BATCH_ROWS = 64 * 1024
+
+
+def read_columns(path: Path | str, columns: list[str]) -> dict:
+    """Read some columns of a file as NumPy arrays.
+
+    Args:
+        path: file to read.
+        columns: names of the columns to read.
+
+    Returns:
+        Dict mapping column names to one-dimensional arrays.
+        `datetime64` columns are converted to epoch milliseconds.
+    """
+    np = _import("numpy")
+    raw = _read_all(path, columns)
+    return {name: _as_numbers(np, values) for name, values in raw.items()}
+
+
+def scatter_datasets(path, *, x, y, series=None, max_points=None):
+    """Build Scatter datasets from columns of a file.
+
+    Args:
+        path: file to read.
+        x: name of the column of x-values.
+        y: name of the column of y-values.
+        series: optional name of a column whose values split the points
+            into one labelled dataset each.
+        max_points: optional limit on the number of points per dataset;
+            larger datasets are thinned to evenly spaced points.
+
+    Returns:
+        List of dataset dicts for `Scatter`.
+    """
+    np = _import("numpy")
+    names = [x, y] if series is None else [x, y, series]
+    samples: dict = {}
+    for batch in _batches(path, names):
+        xs = _as_numbers(np, batch[x])
+        ys = _as_numbers(np, batch[y])
+        if series is None:
+            groups = [(None, slice(None))]
+        else:
+            keys, inverse = np.unique(batch[series], return_inverse=True)
+            groups = [(key, inverse == i) for i, key in enumerate(keys.tolist())]
+        for key, selector in groups:
+            if key not in samples:
+                samples[key] = _Sample(np, max_points)
+            samples[key].add(xs[selector], ys[selector])
+
+    datasets = []
+    for key in sorted(samples):
+        xs, ys = samples[key].result()
+        dataset = {"data": [{"x": a, "y": b} for a, b in zip(xs.tolist(), ys.tolist())]}
+        if key is not None:
+            dataset["label"] = str(key)
+        datasets.append(dataset)
+    return datasets
+
+
+def labelled_datasets(path, *, x, y, max_points=None):
+    """Build labels and datasets for Line or Bar from columns of a file.
+
+    Args:
+        path: file to read.
+        x: name of the column of labels; `datetime64` labels are
+            formatted as UTC text, as in `Line.from_events`.
+        y: name of a column of values, or a list of names (one dataset each).
+        max_points: optional limit on the number of labels; longer
+            series keep the minimum and maximum of each of
+            `max_points // 2` equal runs of rows.
+
+    Returns:
+        Tuple of (labels, datasets).
+    """
+    np = _import("numpy")
+    y_names = [y] if isinstance(y, str) else list(y)
+    if max_points is not None and _count_rows(path) > max_points:
+        labels, values = _extreme_rows(np, path, x, y_names, max_points // 2)
+    else:
+        raw = _read_all(path, [x, *y_names])
+        labels = raw[x]
+        values = {name: _as_numbers(np, raw[name]) for name in y_names}
+    datasets = [{"label": name, "data": values[name]} for name in y_names]
+    if labels.dtype.kind == "M":
+        return _time_labels(np, _as_numbers(np, labels)), datasets
+    return labels.tolist(), datasets
+
+
+class _Sample:
+    """Evenly spaced sample of a stream of points, kept in bounded memory.
+
+    Points whose position in the stream is a multiple of `stride` are
+    kept; whenever more than twice `limit` points are held, every
+    other one is dropped and the stride doubles.
+    """
+
+    def __init__(self, np, limit):
+        self.np = np
+        self.limit = limit
+        self.stride = 1
+        self.seen = 0
+        self.xs = []
+        self.ys = []
+        self.size = 0
+
+    def add(self, xs, ys):
+        """Add the next run of points."""
+        first = -self.seen % self.stride
+        self.seen += len(xs)
+        self.xs.append(xs[first :: self.stride])
+        self.ys.append(ys[first :: self.stride])
+        self.size += len(self.xs[-1])
+        while self.limit is not None and self.size > 2 * self.limit:
+            xs, ys = self.result(thin=False)
+            self.xs, self.ys = [xs[::2]], [ys[::2]]
+            self.size = len(self.xs[0])
+            self.stride *= 2
+
+    def result(self, thin=True):
+        """Return the sampled x- and y-values, at most `limit` of them."""
+        np = self.np
+        xs = np.concatenate(self.xs) if self.xs else np.array([])
+        ys = np.concatenate(self.ys) if self.ys else np.array([])
+        if thin and self.limit is not None and len(xs) > self.limit:
+            keep = np.linspace(0, len(xs) - 1, self.limit).astype(np.int64)
+            xs, ys = xs[keep], ys[keep]
+        return xs, ys
+
+
+def _extreme_rows(np, path, x, y_names, buckets):
+    """Find the rows holding each run's minimum and maximum, batch by batch.
+
+    The rows are split into `buckets` runs of equal length. Besides the
+    first and last row, the rows holding the minimum and maximum of
+    each y-column in each run are kept.
+
+    Returns:
+        Tuple of (array of raw labels, dict mapping y-column names to
+        arrays of values) for the kept rows, in file order.
+    """
+    n = _count_rows(path)
+    buckets = max(buckets, 1)
+    edges = np.linspace(0, n, buckets + 1).astype(np.int64)
+    best = {}
+    kept = {}
+    offset = 0
+    for batch in _batches(path, [x, *y_names]):
+        size = len(batch[x])
+        values = {name: _as_numbers(np, batch[name]) for name in y_names}
+
+        def row(i, batch=batch, values=values):
+            return batch[x][i], [values[name][i] for name in y_names]
+
+        if offset == 0 and size:
+            kept[0] = row(0)
+        if offset + size == n and size:
+            kept[n - 1] = row(size - 1)
+        first = int(np.searchsorted(edges, offset, side="right")) - 1
+        last = int(np.searchsorted(edges, offset + size - 1, side="right")) - 1
+        for run in range(max(first, 0), min(last, buckets - 1) + 1):
+            lo = max(int(edges[run]), offset) - offset
+            hi = min(int(edges[run + 1]), offset + size) - offset
+            if hi <= lo:
+                continue
+            for name in y_names:
+                part = values[name][lo:hi]
+                for kind, i in (("min", part.argmin()), ("max", part.argmax())):
+                    value = part[i]
+                    old = best.get((name, run, kind))
+                    if (
+                        old is None
+                        or (kind == "min" and value < old[0])
+                        or (kind == "max" and value > old[0])
+                    ):
+                        best[(name, run, kind)] = (value, offset + lo + i, row(lo + i))
+        offset += size
+
+    for _, position, found in best.values():
+        kept[position] = found
+    positions = sorted(kept)
+    labels = np.array([kept[p][0] for p in positions])
+    columns = {
+        name: np.array([kept[p][1][j] for p in positions])
+        for j, name in enumerate(y_names)
+    }
+    return labels, columns
+
+
+def _time_labels(np, ms):
+    """Format epoch milliseconds as text at the finest resolution they need."""
+    ms = ms.astype(np.int64)
+    step = int(np.gcd.reduce(ms)) if len(ms) else 0
+    fmt = label_format(step or interval_ms("1d"))
+    return [format_bucket(value, fmt) for value in ms.tolist()]
+
+
+def _read_all(path, columns):
+    """Read whole columns of a file as NumPy arrays of their own types."""
+    np = _import("numpy")
+    parts = {name: [] for name in columns}
+    for batch in _batches(path, columns):
+        for name in columns:
+            parts[name].append(batch[name])
+    return {
+        name: np.concatenate(arrays) if arrays else np.array([])
+        for name, arrays in parts.items()
+    }
+
+
+def _batches(path, columns):
+    """Yield some columns of a file a batch of rows at a time.
+
+    Each batch is a dict mapping column names to NumPy arrays of the
+    columns' own types. Other columns are never read.
+    """
+    np = _import("numpy")
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".npy":
+        array = np.load(path, mmap_mode="r")
+        _check_columns(path, columns, array.dtype.names or ())
+        for start in range(0, len(array), _BATCH_ROWS):
+            rows = array[start : start + _BATCH_ROWS]
+            yield {name: np.asarray(rows[name]) for name in columns}
+    elif suffix in _ARROW_SUFFIXES:
+        reader = _ipc_reader(path)
+        _check_columns(path, columns, reader.schema.names)
+        for i in range(reader.num_record_batches):
+            yield _arrays(reader.get_batch(i), columns)
+    elif suffix == ".parquet":
+        source = _parquet_file(path)
+        _check_columns(path, columns, source.schema_arrow.names)
+        for batch in source.iter_batches(batch_size=_BATCH_ROWS, columns=columns):
+            yield _arrays(batch, columns)
+    else:
+        raise ValueError(f"{path}: unsupported file type {suffix!r}")
+
+
+def _count_rows(path):
+    """Return the number of rows in a file, from its metadata."""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".npy":
+        return len(_import("numpy").load(path, mmap_mode="r"))
+    if suffix in _ARROW_SUFFIXES:
+        return _ipc_reader(path).count_rows()
+    if suffix == ".parquet":
+        return _parquet_file(path).metadata.num_rows
+    raise ValueError(f"{path}: unsupported file type {suffix!r}")
+
+
+def _ipc_reader(path):
+    """Open a memory-mapped Arrow IPC file."""
+    pa = _import("pyarrow")
+    ipc = _import("pyarrow.ipc")
+    return ipc.open_file(pa.memory_map(str(path), "r"))
+
+
+def _parquet_file(path):
+    """Open a Parquet file, memory-mapped where possible."""
+    pq = _import("pyarrow.parquet")
+    return pq.ParquetFile(path, memory_map=True)
+
+
+def _arrays(batch, columns):
+    """Convert some columns of a pyarrow RecordBatch to NumPy arrays."""
+    return {name: batch.column(name).to_numpy(zero_copy_only=False) for name in columns}
+
+
+def _as_numbers(np, values):
+    """Convert datetime64 values to epoch milliseconds."""
+    if values.dtype.kind == "M":
+        return values.astype("datetime64[ms]").astype(np.int64)
+    return values
+
+
+def _check_columns(path, columns, available):
+    """Make sure a file has all the columns asked for."""
+    missing = [name for name in columns if name not in available]
+    if missing:
+        raise ValueError(f"{path}: no column(s) named {', '.join(missing)}")
+
+
+def _import(name):
+    """Import an optional dependency, explaining what is missing if it fails."""
+    import importlib
+
+    try:
+        return importlib.import_module(name)
+    except ImportError as exc:
+        package = name.split(".")[0]
+        raise ImportError(
+            f"reading chart data from files requires the {package} package"
+        ) from exc
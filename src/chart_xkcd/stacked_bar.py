@@ -1,7 +1,7 @@
 """Stacked bar chart."""
 
 from typing import Any
-from .charts import _AxisChart, _check_labels_datasets
+from .charts import _AxisChart, _check_labels_datasets, _stacked_extent
 
 
 class StackedBar(_AxisChart):
@@ -60,3 +60,8 @@ class StackedBar(_AxisChart):
         super().__init__(
             title=title, x_label=x_label, y_label=y_label, data=data, options=options
         )
+
+    def _data_extent(self):
+        """Return the extent of the y-values."""
+        extent = _stacked_extent(self.data["datasets"])
+        return {} if extent is None else {"y": extent}
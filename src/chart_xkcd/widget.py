@@ -1,13 +1,21 @@
 """anywidget-based chart widget for use in marimo and Jupyter notebooks."""
 
-import json
+import math
+import weakref
 from importlib.resources import files
 
 import anywidget
 import traitlets
 
+from .encoder import encode
+from .window import WindowStore
+
 _WIDGET_JS = files("chart_xkcd").joinpath("static", "chart.xkcd.js")
 
+_MAX_BUCKETS = 4096
+
+_REGISTRY = weakref.WeakValueDictionary()
+
 
 class ChartWidget(anywidget.AnyWidget):
     """anywidget wrapper around chart.xkcd.
@@ -23,6 +31,16 @@ class ChartWidget(anywidget.AnyWidget):
         selection: JSON array of currently selected items. Updated by
             click, shift-click, and box-select interactions on the
             front-end.
+        zoomable: Whether the front-end lets the user zoom (mouse wheel)
+            and pan (shift-wheel or horizontal scroll). Each change of
+            the visible x-range is sent as a `window` message, answered
+            from the widget's `WindowStore` with a fresh config for
+            just that range.
+        render_stats: JSON object describing the latest draw, written
+            by the front-end once the chart has been painted: the
+            milliseconds spent in each phase (`loadFont`, `construct`,
+            `setup`, `paint`) and the number of SVG elements (`nodes`).
+            Read-only from Python.
     """
 
     _esm = _WIDGET_JS
@@ -31,22 +49,83 @@ class ChartWidget(anywidget.AnyWidget):
     width = traitlets.Int(600).tag(sync=True)
     height = traitlets.Int(400).tag(sync=True)
     selection = traitlets.Unicode("[]").tag(sync=True)
+    zoomable = traitlets.Bool(False).tag(sync=True)
+    render_stats = traitlets.Unicode("{}", read_only=True).tag(sync=True)
+
+    def __init__(self, *, store=None, **kwargs):
+        super().__init__(**kwargs)
+        self._store = store
+        self.on_msg(self._handle_msg)
 
+    def _handle_msg(self, widget, content, buffers):
+        """Answer a front-end request for a window of the data."""
+        if self._store is None or not isinstance(content, dict):
+            return
+        if content.get("type") != "window":
+            return
+        x0, x1, width = content.get("x0"), content.get("x1"), content.get("width")
+        if not (_is_coordinate(x0) and _is_coordinate(x1)):
+            return
+        if not _is_coordinate(width) or not width:
+            width = self.width
+        buckets = min(max(int(width), 1), _MAX_BUCKETS)
+        config = self._store.window(x0, x1, buckets)
+        self.send(
+            {"type": "window", "seq": content.get("seq"), "config": encode(config)}
+        )
 
-def to_widget(chart, width=600, height=400):
+
+def to_widget(chart, width=600, height=400, zoomable=False, key=None):
     """Convert a chart object to an anywidget for display in marimo or Jupyter.
 
     Args:
         chart: a chart object (Bar, Line, Pie, etc.).
         width: chart width in pixels.
         height: chart height in pixels.
+        zoomable: keep the data on the Python side and send only the
+            visible window, downsampled to the chart's width, letting
+            the user zoom and pan (Line and Scatter only).
+        key: optional name for the widget. If a widget created with the
+            same key still exists, it is updated in place (in a single
+            sync message) and returned instead of creating a new one, so
+            re-running a notebook cell redraws the chart it already shows.
+            Changing `zoomable` creates a new widget, since the front-end
+            sets up zooming only when a widget is first displayed.
 
     Returns:
         A ChartWidget instance.
     """
-    return ChartWidget(
-        config=json.dumps(chart.to_dict()),
-        chart_type=type(chart).__name__,
-        width=width,
-        height=height,
-    )
+    store = None
+    config = chart.to_dict()
+    if zoomable:
+        store = WindowStore(chart)
+        config = store.window(buckets=min(width, _MAX_BUCKETS))
+    traits = {
+        "config": encode(config),
+        "chart_type": chart.chart_type,
+        "width": width,
+        "height": height,
+        "zoomable": zoomable,
+    }
+    widget = _REGISTRY.get(key) if key is not None else None
+    if widget is None or widget.zoomable != zoomable:
+        widget = ChartWidget(store=store, **traits)
+        if key is not None:
+            _REGISTRY[key] = widget
+        return widget
+    widget._store = store
+    with widget.hold_sync():
+        if widget.config != traits["config"]:
+            widget.selection = "[]"
+        for name, value in traits.items():
+            setattr(widget, name, value)
+    return widget
+
+
+def _is_coordinate(value):
+    """Is a value sent by the front-end None or a finite number?"""
+    if value is None:
+        return True
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return False
+    return math.isfinite(value)
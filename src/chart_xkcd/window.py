@@ -0,0 +1,214 @@
+"""Windowed, downsampled views of Line and Scatter data.
+
+`WindowStore` keeps a sorted copy of a chart's data on the Python
+side and answers requests for the part of it inside an x-range,
+downsampled to the requested number of buckets. Zoomable widgets
+(see `to_widget(..., zoomable=True)`) use it so that only the
+visible window, at screen resolution, is ever sent to the browser.
+
+Line charts are windowed by label index; Scatter charts by x-value
+(dates and datetimes are compared as epoch milliseconds), found by
+bisecting the sorted x-values. Scatter x-values must be numbers,
+dates or datetimes: strings cannot be windowed. When NumPy is
+installed, y-values are also kept as float arrays and each bucket's
+minimum and maximum are found with vectorized reductions.
+"""
+
+import bisect
+import copy
+import datetime
+import math
+import numbers
+
+from .charts import _BaseChart, _datasets_extent
+from .encoder import epoch_ms
+
+
+class WindowStore:
+    """Sorted, bisect-indexed copy of a Line or Scatter chart's data.
+
+    Args:
+        chart: a `Line` or `Scatter` chart.
+    """
+
+    def __init__(self, chart: _BaseChart):
+        self.chart_type = chart.chart_type
+        if self.chart_type not in ("Line", "Scatter"):
+            raise TypeError(
+                f"{self.chart_type}: only Line and Scatter charts can be windowed"
+            )
+        config = chart.to_dict()
+        data = config.pop("data")
+        self._base = config
+        self._datasets = [
+            {k: v for k, v in ds.items() if k != "data"} for ds in data["datasets"]
+        ]
+        if self.chart_type == "Line":
+            self._labels = list(data["labels"])
+            self._values = [list(ds["data"]) for ds in data["datasets"]]
+            self._ys = [_reducible(values) for values in self._values]
+            self.x_min, self.x_max = 0, max(len(self._labels) - 1, 0)
+        else:
+            self._xs = []
+            self._ys = []
+            self._points = []
+            for ds in data["datasets"]:
+                points = sorted(ds["data"], key=lambda pt: _x_key(pt["x"]))
+                self._xs.append([_x_key(pt["x"]) for pt in points])
+                self._ys.append(_reducible([pt["y"] for pt in points]))
+                self._points.append(points)
+            all_xs = [xs for xs in self._xs if xs]
+            self.x_min = min((xs[0] for xs in all_xs), default=0)
+            self.x_max = max((xs[-1] for xs in all_xs), default=0)
+
+    def window(self, x0=None, x1=None, buckets=600) -> dict:
+        """Return a chart config for the data inside `[x0, x1]`.
+
+        Each dataset is reduced to at most two points (its minimum and
+        maximum y-value) per bucket, plus the window's end points.
+
+        Args:
+            x0: start of the window (default: start of the data).
+            x1: end of the window (default: end of the data).
+            buckets: number of buckets, usually the chart width in pixels.
+
+        Returns:
+            A config dict in the shape produced by `to_dict()`, with an
+            extra `window` entry giving the window and the full range.
+        """
+        x0 = self.x_min if x0 is None else max(x0, self.x_min)
+        x1 = self.x_max if x1 is None else min(x1, self.x_max)
+        if x1 < x0:
+            x0, x1 = x1, x0
+        buckets = max(int(buckets), 1)
+        if self.chart_type == "Line":
+            data = self._line_window(x0, x1, buckets)
+        else:
+            data = self._scatter_window(x0, x1, buckets)
+        data["window"] = {"x0": x0, "x1": x1, "min": self.x_min, "max": self.x_max}
+        config = copy.copy(self._base)
+        config["data"] = data
+        return config
+
+    def _line_window(self, x0, x1, buckets):
+        """Select labels and values for a range of label indices."""
+        lo = math.ceil(x0)
+        hi = math.floor(x1) + 1
+        if hi <= lo:
+            lo = max(hi - 1, 0)
+        picked = set()
+        for ys in self._ys:
+            picked.update(minmax_indices(ys, lo, hi, buckets))
+        indices = sorted(picked)
+        datasets = [
+            {**meta, "data": [values[i] for i in indices]}
+            for meta, values in zip(self._datasets, self._values)
+        ]
+        data: dict = {
+            "labels": [self._labels[i] for i in indices],
+            "datasets": datasets,
+        }
+        extent = _datasets_extent(datasets) if indices else None
+        if extent is not None:
+            data["extent"] = {"y": extent}
+        return data
+
+    def _scatter_window(self, x0, x1, buckets):
+        """Select points whose x-values lie in a range."""
+        datasets = []
+        for meta, xs, ys, points in zip(
+            self._datasets, self._xs, self._ys, self._points
+        ):
+            lo = bisect.bisect_left(xs, x0)
+            hi = bisect.bisect_right(xs, x1)
+            indices = minmax_indices(ys, lo, hi, buckets)
+            datasets.append({**meta, "data": [points[i] for i in indices]})
+        data = {"datasets": datasets, "extent": {"x": [x0, x1]}}
+        y_extent = _datasets_extent(
+            [{"data": [pt["y"] for pt in ds["data"]]} for ds in datasets if ds["data"]]
+        )
+        if y_extent is not None:
+            data["extent"]["y"] = y_extent
+        return data
+
+
+def minmax_indices(values, lo, hi, buckets):
+    """Choose indices in `[lo, hi)` that preserve the shape of some values.
+
+    The range is split into `buckets` runs of equal length and the
+    indices of the smallest and largest value in each run are kept,
+    along with both ends of the range. `None` values are skipped.
+    NumPy arrays are reduced without a Python-level loop over values
+    (NaN is skipped like `None`).
+
+    Args:
+        values: sequence or NumPy array of numbers (or None).
+        lo: first index to consider.
+        hi: one past the last index to consider.
+        buckets: number of runs to split the range into.
+
+    Returns:
+        Sorted list of at most `2 * buckets + 2` indices.
+    """
+    lo = max(lo, 0)
+    hi = min(hi, len(values))
+    count = hi - lo
+    if count <= 2 * buckets:
+        return list(range(lo, max(hi, lo)))
+    if getattr(values, "dtype", None) is not None:
+        return _minmax_array(values, lo, hi, buckets)
+    picked = {lo, hi - 1}
+    for b in range(buckets):
+        start = lo + count * b // buckets
+        stop = lo + count * (b + 1) // buckets
+        present = [i for i in range(start, stop) if values[i] is not None]
+        if present:
+            picked.add(min(present, key=values.__getitem__))
+            picked.add(max(present, key=values.__getitem__))
+    return sorted(picked)
+
+
+def _minmax_array(values, lo, hi, buckets):
+    """Vectorized `minmax_indices`, for float arrays of more than `2 * buckets`."""
+    import numpy as np
+
+    part = values[lo:hi]
+    count = hi - lo
+    starts = count * np.arange(buckets) // buckets
+    lengths = np.diff(starts, append=count)
+    picked = {lo, hi - 1}
+    for reduce in (np.fmin, np.fmax):
+        extremes = reduce.reduceat(part, starts)
+        hits = np.flatnonzero(part == np.repeat(extremes, lengths))
+        runs = np.searchsorted(starts, hits, side="right") - 1
+        # As with min()/max(), the first of several equal values wins.
+        _, first = np.unique(runs, return_index=True)
+        picked.update((lo + hits[first]).tolist())
+    return sorted(picked)
+
+
+def _reducible(values):
+    """Return values as a float array if NumPy can hold them, else unchanged."""
+    try:
+        import numpy as np
+    except ImportError:
+        return values
+    try:
+        return np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+        return values
+
+
+def _x_key(x):
+    """Turn an x-value into a number that can be bisected."""
+    if isinstance(x, datetime.date):
+        return epoch_ms(x)
+    dtype = getattr(x, "dtype", None)
+    if dtype is not None and dtype.kind == "M":
+        return int(x.astype("datetime64[ms]").astype("int64"))
+    if isinstance(x, numbers.Real) and not isinstance(x, bool):
+        return x
+    raise TypeError(
+        f"Scatter: cannot window x-value {x!r}; zoomable charts need "
+        "numbers, dates or datetimes as x-values"
+    )
@@ -0,0 +1,70 @@
+import tarfile
+import zipfile
+
+import pytest
+
+from chart_xkcd import Line, render_archive
+
+
+def chart(title="t"):
+    return Line(title=title, labels=["a", "b"], datasets=[{"data": [1, 2]}])
+
+
+def test_zip_entries_are_named_and_nested(tmp_path):
+    path = tmp_path / "site.zip"
+    names = render_archive(
+        {"q1": chart(), "sales/q2": chart()}, path, chart_js_url="/js/chart.js"
+    )
+    assert names == ["q1.html", "sales/q2.html"]
+    with zipfile.ZipFile(path) as archive:
+        assert archive.namelist() == names
+        assert "/js/chart.js" in archive.read("sales/q2.html").decode()
+
+
+@pytest.mark.parametrize("suffix", [".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz"])
+def test_tar_formats(tmp_path, suffix):
+    path = tmp_path / f"site{suffix}"
+    names = render_archive([chart(), chart()], path, chart_js_url="chart.js")
+    assert names == ["chart-0.html", "chart-1.html"]
+    with tarfile.open(path) as archive:
+        assert archive.getnames() == names
+
+
+def test_failure_leaves_the_destination_untouched(tmp_path):
+    path = tmp_path / "site.zip"
+    render_archive({"old": chart()}, path, chart_js_url="chart.js")
+
+    def charts():
+        yield chart()
+        raise RuntimeError("data went away")
+
+    with pytest.raises(RuntimeError):
+        render_archive(charts(), path, chart_js_url="chart.js")
+    with zipfile.ZipFile(path) as archive:
+        assert archive.namelist() == ["old.html"]
+    assert [p.name for p in tmp_path.iterdir()] == ["site.zip"]
+
+
+def test_duplicate_entries_are_rejected(tmp_path):
+    path = tmp_path / "site.zip"
+    with pytest.raises(ValueError, match="duplicate"):
+        render_archive({"a": chart(), "a.html": chart()}, path, chart_js_url="c.js")
+    assert not path.exists()
+
+
+@pytest.mark.parametrize("name", ["", "/abs", "../up", "a/../../b"])
+def test_unsafe_names_are_rejected(tmp_path, name):
+    with pytest.raises(ValueError, match="invalid chart name"):
+        render_archive({name: chart()}, tmp_path / "site.zip", chart_js_url="c.js")
+
+
+@pytest.mark.parametrize(
+    ("filename", "compression"),
+    [("site.rar", None), ("site.zip", "gz"), ("site.tar.gz", "zstd")],
+)
+def test_unknown_formats_are_rejected(tmp_path, filename, compression):
+    with pytest.raises(ValueError):
+        render_archive(
+            [chart()], tmp_path / filename, compression=compression, chart_js_url="c"
+        )
+    assert list(tmp_path.iterdir()) == []
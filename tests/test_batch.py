@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+from chart_xkcd.batch import MANIFEST_NAME, chart_from_spec, render_specs
+
+LINE = {
+    "type": "Line",
+    "title": "temperatures",
+    "labels": ["Mon", "Tue"],
+    "datasets": [{"label": "NYC", "data": [65, 70]}],
+}
+
+
+@pytest.fixture
+def specs(tmp_path):
+    spec_dir = tmp_path / "specs"
+    (spec_dir / "sub").mkdir(parents=True)
+    (spec_dir / "good.json").write_text(json.dumps(LINE))
+    (spec_dir / "sub" / "also.json").write_text(json.dumps(LINE))
+    (spec_dir / "unknown.json").write_text(json.dumps({"type": "Donut"}))
+    (spec_dir / "broken.json").write_text("{not json")
+    return spec_dir
+
+
+def render(spec_dir, out_dir, **kwargs):
+    return render_specs(spec_dir, out_dir, "chart.xkcd.js", jobs=1, **kwargs)
+
+
+def test_bad_specs_are_reported_without_stopping_the_batch(specs, tmp_path):
+    out = tmp_path / "out"
+    report = render(specs, out)
+    assert sorted(report.rendered) == ["good", "sub/also"]
+    assert sorted(report.failed) == ["broken", "unknown"]
+    assert report.failed["unknown"].startswith("ValueError: unknown chart type")
+    assert report.failed["broken"].startswith("JSONDecodeError")
+    assert "chart.xkcd.js" in (out / "sub" / "also.html").read_text()
+    assert not (out / "unknown.html").exists()
+
+
+def test_worker_processes_give_the_same_report(specs, tmp_path):
+    report = render_specs(specs, tmp_path / "out", "chart.xkcd.js", jobs=2)
+    assert sorted(report.rendered) == ["good", "sub/also"]
+    assert sorted(report.failed) == ["broken", "unknown"]
+
+
+def test_unchanged_specs_are_skipped_and_failures_retried(specs, tmp_path):
+    out = tmp_path / "out"
+    render(specs, out)
+    report = render(specs, out)
+    assert sorted(report.skipped) == ["good", "sub/also"]
+    assert sorted(report.failed) == ["broken", "unknown"]
+    assert render(specs, out, force=True).skipped == []
+
+
+def test_edited_outputs_and_changed_settings_are_rerendered(specs, tmp_path):
+    out = tmp_path / "out"
+    render(specs, out)
+    (out / "good.html").write_text("edited")
+    assert sorted(render(specs, out).rendered) == ["good"]
+    assert sorted(render(specs, out, width=300).rendered) == ["good", "sub/also"]
+
+
+def test_manifest_drops_deleted_specs(specs, tmp_path):
+    out = tmp_path / "out"
+    render(specs, out)
+    (specs / "good.json").unlink()
+    render(specs, out)
+    manifest = json.loads((out / MANIFEST_NAME).read_text())
+    assert sorted(manifest) == ["sub/also"]
+
+
+def test_missing_spec_directory(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        render(tmp_path / "nowhere", tmp_path / "out")
+
+
+def test_chart_from_spec_rejects_non_objects():
+    with pytest.raises(TypeError):
+        chart_from_spec(json.loads("[1, 2]"))
@@ -0,0 +1,75 @@
+import datetime
+import decimal
+import json
+import math
+
+import pytest
+
+from chart_xkcd import encoder
+from chart_xkcd.encoder import encode, register, set_backend
+
+BACKENDS = [
+    "json",
+    pytest.param(
+        "orjson",
+        marks=pytest.mark.skipif(encoder.orjson is None, reason="needs orjson"),
+    ),
+]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    set_backend(request.param)
+    yield request.param
+    set_backend("auto")
+
+
+def test_non_finite_floats_become_null(backend):
+    value = {"data": [1.5, math.nan, (math.inf, -math.inf)]}
+    assert json.loads(encode(value)) == {"data": [1.5, None, [None, None]]}
+
+
+def test_finite_values_are_encoded_unchanged(backend):
+    value = {"b": [1, 2.5, "x", None, True], "a": {"c": []}}
+    assert json.loads(encode(value, sort_keys=True)) == value
+
+
+def test_circular_reference_is_an_error(backend):
+    value = {"data": []}
+    value["data"].append(value)
+    with pytest.raises((TypeError, ValueError)):
+        encode(value)
+
+
+def test_dates_decimals_and_registered_types(backend):
+    class Point:
+        def __init__(self, x):
+            self.x = x
+
+    register(Point, lambda p: {"x": p.x})
+    value = [
+        datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC),
+        datetime.date(1970, 1, 2),
+        decimal.Decimal("2.5"),
+        Point(math.nan),
+    ]
+    assert json.loads(encode(value)) == [
+        1_704_067_200_000,
+        86_400_000,
+        2.5,
+        {"x": None},
+    ]
+
+
+def test_numpy_arrays_and_datetime64():
+    np = pytest.importorskip("numpy")
+    value = {
+        "values": np.array([1, 2]),
+        "times": np.array(["1970-01-01T00:00:01"], dtype="datetime64[s]"),
+    }
+    assert json.loads(encode(value)) == {"values": [1, 2], "times": [1000]}
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        set_backend("yaml")
@@ -0,0 +1,60 @@
+import math
+
+import pytest
+
+from chart_xkcd import Bar, Facet, Line, Scatter
+
+ROWS = [
+    {"site": "A", "week": 1, "count": 3},
+    {"site": "B", "week": 1, "count": 10},
+    {"site": "A", "week": 2, "count": -2},
+    {"site": "B", "week": 2, "count": 4},
+]
+
+
+def test_rows_are_split_into_panels_in_order():
+    facet = Facet(Line, ROWS, by="site", x="week", y="count", ncols=2)
+    assert facet.keys == ["A", "B"]
+    assert [c.title for c in facet.charts] == ["A", "B"]
+    assert facet.charts[1].data["datasets"][0]["data"] == [10, 4]
+
+
+def test_panels_share_the_y_extent():
+    facet = Facet(Bar, ROWS, by="site", x="week", y="count")
+    assert [c.extent for c in facet.charts] == [{"y": [-2, 10]}] * 2
+    assert facet.charts[0].to_dict()["data"]["extent"] == {"y": [-2, 10]}
+
+
+def test_unshared_panels_keep_their_own_extent():
+    facet = Facet(Line, ROWS, by="site", x="week", y="count", share_y=False)
+    assert [c.extent for c in facet.charts] == [{"y": [-2, 3]}, {"y": [4, 10]}]
+
+
+def test_panels_without_numbers_still_get_the_shared_extent():
+    columns = {"g": ["A", "A", "B"], "x": [1, 2, 1], "y": [1, 5, math.nan]}
+    facet = Facet(Line, columns, by="g", x="x", y="y")
+    assert [c.extent for c in facet.charts] == [{"y": [1, 5]}] * 2
+
+
+def test_scatter_panels_can_share_x():
+    facet = Facet(Scatter, ROWS, by="site", x="count", y="week", share_x=True)
+    assert [c.extent["x"] for c in facet.charts] == [[-2, 10]] * 2
+
+
+def test_page_uses_a_lazy_grid():
+    facet = Facet(Line, ROWS, by="site", x="week", y="count", ncols=3)
+    page = facet.to_html(chart_js_url="/c.js")
+    assert "grid-template-columns:repeat(3,300px);" in page
+    assert "IntersectionObserver" in page
+    assert "IntersectionObserver" not in facet.to_html(chart_js_url="/c.js", lazy=False)
+
+
+def test_bad_arguments():
+    with pytest.raises(ValueError, match="ncols"):
+        Facet(Line, ROWS, by="site", x="week", y="count", ncols=0)
+    with pytest.raises(ValueError, match="single y column"):
+        Facet(Scatter, ROWS, by="site", x="week", y=["count", "week"])
+    with pytest.raises(ValueError, match="no column"):
+        Facet(Line, {"site": [], "week": []}, by="site", x="week", y="count")
+    with pytest.raises(TypeError, match="rows or a dict"):
+        Facet(Line, 42, by="site", x="week", y="count")
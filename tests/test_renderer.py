@@ -0,0 +1,119 @@
+import asyncio
+import json
+import re
+
+import pytest
+
+from chart_xkcd import (
+    Bar,
+    Line,
+    Pie,
+    iter_html_async,
+    render_async,
+    render_page,
+    to_html,
+    to_html_async,
+    to_html_page,
+)
+
+LABELS = ["a", "b", "c"]
+
+
+@pytest.fixture
+def line():
+    return Line(
+        title="line", labels=LABELS, datasets=[{"label": "x", "data": [1, 2, 3]}]
+    )
+
+
+def test_to_html_imports_the_chart_class(line):
+    page = to_html(line, chart_js_url="/chart.js", width=300, height=200)
+    assert "import { Line } from '/chart.js';" in page
+    assert "new Line(svg, " in page
+    assert "width:300px;height:200px;" in page
+
+
+def test_options_add_their_helpers(line):
+    page = to_html(line, chart_js_url="/chart.js", responsive=True, stats=True)
+    assert "import { Line, fitToContainer, measureChart } from '/chart.js';" in page
+    assert "measureChart('Line', Line, svg, " in page
+    assert "fitToContainer(svg);" in page
+
+
+def test_page_options_are_rejected_for_single_charts(line):
+    with pytest.raises(TypeError):
+        to_html(line, chart_js_url="/chart.js", lazy=True)
+
+
+def test_modules_url_imports_only_the_charts_used(line):
+    page = to_html_page([line, line], modules_url="/static/modules/")
+    assert "import Line from '/static/modules/Line.js';" in page
+    assert "Bar.js" not in page
+    with pytest.raises(ValueError, match="cannot be combined"):
+        to_html(line, inline=True, modules_url="/static/modules")
+
+
+def test_chart_js_url_is_required(line):
+    with pytest.raises(ValueError, match="chart_js_url is required"):
+        to_html(line)
+
+
+def test_page_imports_each_class_once(line):
+    bar = Bar(labels=LABELS, datasets=[{"data": [3, 2, 1]}])
+    page = to_html_page([line, bar, line], chart_js_url="/c.js", title="<dash>")
+    assert "import { Bar, Line } from '/c.js';" in page
+    assert page.count("new Line(") == 2
+    assert "<title>&lt;dash&gt;</title>" in page
+
+
+def test_shared_data_is_written_once(line):
+    pie = Pie(labels=LABELS, datasets=[{"data": [1, 2, 3]}])
+    page = to_html_page([line, pie], chart_js_url="/c.js", share_data=True)
+    registry = re.search(r'id="chart-data">(.*?)</script>', page)
+    assert registry is not None
+    assert json.loads(registry[1]) == {"d0": LABELS, "d1": [1, 2, 3]}
+    assert page.count('"$ref": "d0"') == 2
+
+
+def test_lazy_pages_observe_each_panel(line):
+    page = to_html_page([line, line], chart_js_url="/c.js", lazy=True, columns=2)
+    assert page.count("pending.set('chart-") == 2
+    assert "IntersectionObserver" in page
+    assert "grid-template-columns:repeat(2,600px);" in page
+    with pytest.raises(ValueError, match="columns must be positive"):
+        to_html_page([line], chart_js_url="/c.js", columns=0)
+
+
+def test_render_page_writes_the_page(line, tmp_path):
+    path = tmp_path / "page.html"
+    render_page([line], path, chart_js_url="/c.js", stats=True)
+    assert path.read_text() == to_html_page([line], chart_js_url="/c.js", stats=True)
+
+
+def test_async_rendering_matches_sync(line, tmp_path):
+    expected = to_html(line, chart_js_url="/c.js", responsive=True)
+
+    async def run():
+        text = await to_html_async(line, chart_js_url="/c.js", responsive=True)
+        chunks = [
+            chunk
+            async for chunk in iter_html_async(
+                line, chart_js_url="/c.js", chunk_size=16, responsive=True
+            )
+        ]
+        await render_async(line, tmp_path / "c.html", chart_js_url="/c.js")
+        return text, chunks
+
+    text, chunks = asyncio.run(run())
+    assert text == expected
+    assert "".join(chunks) == expected
+    assert max(len(chunk) for chunk in chunks[1:-1]) <= 16
+    assert (tmp_path / "c.html").read_text() == to_html(line, chart_js_url="/c.js")
+
+
+def test_iter_html_async_rejects_empty_chunks(line):
+    async def run():
+        return [chunk async for chunk in iter_html_async(line, "/c.js", chunk_size=0)]
+
+    with pytest.raises(ValueError, match="chunk_size"):
+        asyncio.run(run())
@@ -0,0 +1,77 @@
+import datetime
+
+import pytest
+
+from chart_xkcd import Line
+from chart_xkcd.resample import fill_gaps, format_bucket, interval_ms, resample
+
+np = pytest.importorskip("numpy")
+
+MINUTE = 60_000
+START = 1_704_067_200_000  # 2024-01-01T00:00:00Z
+
+
+def test_datetime64_array_is_bucketed_as_epoch_ms():
+    ts = np.array(
+        ["2024-01-01T00:00:00", "2024-01-01T00:00:30", "2024-01-01T00:01:10"],
+        dtype="datetime64[s]",
+    )
+    buckets, columns = resample(ts, np.array([1.0, 3.0, 5.0]), every="1min")
+    assert buckets == [START, START + MINUTE]
+    assert columns == {None: [2.0, 5.0]}
+
+
+@pytest.mark.parametrize(
+    "ts",
+    [
+        [np.datetime64("2024-01-01T00:00:00"), np.datetime64("2024-01-01T00:01:10")],
+        [np.int64(START), np.int64(START + 70_000)],
+        [
+            datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC),
+            datetime.datetime(2024, 1, 1, 0, 1, 10, tzinfo=datetime.UTC),
+        ],
+    ],
+)
+def test_streamed_timestamps_agree_with_vectorized(ts):
+    buckets, columns = resample(ts, [1, 5], every="1min", agg="sum")
+    assert buckets == [START, START + MINUTE]
+    assert columns == {None: [1, 5]}
+
+
+def test_missing_series_buckets_are_none_until_filled():
+    ts = [START, START + 2 * MINUTE, START + 3 * MINUTE]
+    buckets, columns = resample(
+        ts, [1, 1, 1], every="1min", agg="count", series=["a", "a", "b"]
+    )
+    assert buckets == [START, START + 2 * MINUTE, START + 3 * MINUTE]
+    assert columns == {"a": [1, 1, None], "b": [None, None, 1]}
+    buckets, columns = fill_gaps(buckets, columns, every="1min", agg="count")
+    assert buckets == [START + i * MINUTE for i in range(4)]
+    assert columns == {"a": [1, 0, 1, 0], "b": [0, 0, 0, 1]}
+
+
+def test_from_events_labels_every_bucket():
+    chart = Line.from_events(
+        [START, START + 2 * MINUTE], [4, 6], every="1min", title="events"
+    )
+    assert chart.data["labels"] == [
+        "2024-01-01 00:00",
+        "2024-01-01 00:01",
+        "2024-01-01 00:02",
+    ]
+    assert chart.data["datasets"] == [{"data": [4, None, 6]}]
+
+
+def test_sub_second_buckets_show_milliseconds():
+    assert format_bucket(START + 250, "%H:%M:%S.%f") == "00:00:00.250"
+
+
+@pytest.mark.parametrize("every", ["0s", "fortnight", -5])
+def test_bad_intervals_are_rejected(every):
+    with pytest.raises(ValueError):
+        interval_ms(every)
+
+
+def test_unknown_aggregation_is_rejected():
+    with pytest.raises(ValueError, match="agg must be one of"):
+        resample([START], [1], every="1s", agg="median")
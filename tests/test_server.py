@@ -0,0 +1,87 @@
+import gzip
+
+import pytest
+
+from chart_xkcd import Line
+from chart_xkcd.server import ChartApp
+
+
+@pytest.fixture
+def app():
+    chart = Line(title="t", labels=["a", "b"], datasets=[{"data": [1, 2]}])
+    return ChartApp(charts={"temps": chart})
+
+
+@pytest.fixture
+def etag(app):
+    status, headers, _ = app.respond("GET", "/temps.html", {})
+    assert status == 200
+    return dict(headers)["ETag"]
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        "{etag}",
+        "W/{etag}",
+        '"other", {etag}',
+        '"a,b",W/{etag} , "c"',
+        "*",
+        " * ",
+    ],
+)
+def test_matching_if_none_match_gets_304(app, etag, header):
+    status, headers, body = app.respond(
+        "GET", "/temps.html", {"if-none-match": header.format(etag=etag)}
+    )
+    assert status == 304
+    assert body == b""
+    assert dict(headers)["ETag"] == etag
+
+
+@pytest.mark.parametrize(
+    "header", ["", '"other"', "{bare}", '"{bare}x"', '"x,{bare}"', "W/*"]
+)
+def test_other_if_none_match_gets_200(app, etag, header):
+    bare = etag.strip('"')
+    status, _, body = app.respond(
+        "GET", "/temps.html", {"if-none-match": header.format(bare=bare)}
+    )
+    assert status == 200
+    assert body
+
+
+def test_star_does_not_match_a_missing_asset(app):
+    status, _, _ = app.respond("GET", "/nowhere.html", {"if-none-match": "*"})
+    assert status == 404
+
+
+def test_etag_changes_with_the_chart(app, etag):
+    app.add_chart("temps", Line(labels=["a"], datasets=[{"data": [3]}]))
+    status, _, _ = app.respond("GET", "/temps.html", {"if-none-match": etag})
+    assert status == 200
+
+
+def test_head_has_headers_but_no_body(app):
+    status, headers, body = app.respond("HEAD", "/temps.html", {})
+    assert status == 200
+    assert int(dict(headers)["Content-Length"]) > 0
+    assert body == b""
+
+
+def test_other_methods_are_not_allowed(app):
+    status, headers, _ = app.respond("POST", "/temps.html", {})
+    assert status == 405
+    assert dict(headers)["Allow"] == "GET, HEAD"
+
+
+def test_gzip_is_sent_to_clients_that_accept_it(app):
+    values = list(range(500))
+    app.add_chart("big", Line(labels=values, datasets=[{"data": values}]))
+    _, _, plain = app.respond("GET", "/big.html", {})
+    status, headers, body = app.respond(
+        "GET", "/big.html", {"accept-encoding": "br;q=0, gzip"}
+    )
+    assert status == 200
+    assert dict(headers)["Content-Encoding"] == "gzip"
+    assert gzip.decompress(body) == plain
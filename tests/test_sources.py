@@ -0,0 +1,93 @@
+import pytest
+
+from chart_xkcd import Line, Scatter, sources
+
+np = pytest.importorskip("numpy")
+
+ROWS = 100
+
+
+@pytest.fixture(autouse=True)
+def small_batches(monkeypatch):
+    monkeypatch.setattr(sources, "_BATCH_ROWS", 7)
+
+
+@pytest.fixture
+def table():
+    return {
+        "t": np.datetime64("2024-01-01") + np.arange(ROWS),
+        "x": np.arange(ROWS, dtype=np.float64),
+        "y": (np.arange(ROWS) * 37 % 101).astype(np.int64),
+        "s": np.array(["a", "b"] * (ROWS // 2)),
+    }
+
+
+def write_npy(path, table):
+    dtype = [(name, values.dtype) for name, values in table.items()]
+    rows = np.zeros(ROWS, dtype=dtype)
+    for name, values in table.items():
+        rows[name] = values
+    np.save(path, rows)
+
+
+def write_arrow(path, table):
+    pa = pytest.importorskip("pyarrow")
+    batch = pa.table(table)
+    if path.suffix == ".parquet":
+        pq = pytest.importorskip("pyarrow.parquet")
+        pq.write_table(batch, path, row_group_size=30)
+    else:
+        with pa.ipc.new_file(path, batch.schema) as writer:
+            writer.write_table(batch, max_chunksize=30)
+
+
+@pytest.fixture(params=[".npy", ".arrow", ".parquet"])
+def path(request, tmp_path, table):
+    path = tmp_path / f"data{request.param}"
+    if request.param == ".npy":
+        write_npy(path, table)
+    else:
+        write_arrow(path, table)
+    return path
+
+
+def test_read_columns_converts_dates_to_epoch_ms(path, table):
+    columns = sources.read_columns(path, ["t", "y"])
+    assert columns["t"][1] - columns["t"][0] == 86_400_000
+    assert columns["y"].tolist() == table["y"].tolist()
+
+
+def test_scatter_datasets_split_by_series_and_thin(path):
+    datasets = sources.scatter_datasets(path, x="x", y="y", series="s", max_points=10)
+    assert [ds["label"] for ds in datasets] == ["a", "b"]
+    for ds in datasets:
+        xs = [pt["x"] for pt in ds["data"]]
+        assert len(xs) == 10
+        assert xs == sorted(xs)
+    assert datasets[0]["data"][0] == {"x": 0.0, "y": 0}
+
+
+def test_labelled_datasets_keep_extremes(path, table):
+    labels, datasets = sources.labelled_datasets(path, x="t", y=["y"], max_points=20)
+    values = datasets[0]["data"].tolist()
+    assert labels[0] == "2024-01-01"
+    assert labels[-1] == "2024-04-09"
+    assert labels == sorted(labels)
+    assert len(labels) <= 22
+    assert min(values) == table["y"].min()
+    assert max(values) == table["y"].max()
+
+
+def test_chart_constructors_read_files(path):
+    line = Line.from_file(path, x="t", y="y")
+    assert len(line.data["labels"]) == ROWS
+    assert line.extent == {"y": [0, 100]}
+    scatter = Scatter.from_file(path, x="x", y="y", max_points=5)
+    assert len(scatter.data["datasets"][0]["data"]) == 5
+
+
+def test_missing_columns_and_formats(path, tmp_path):
+    with pytest.raises(ValueError, match="no column"):
+        sources.read_columns(path, ["y", "nope"])
+    with pytest.raises(ValueError, match="unsupported file type"):
+        sources.read_columns(tmp_path / "data.csv", ["y"])
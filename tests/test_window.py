@@ -0,0 +1,77 @@
+import datetime
+import random
+
+import pytest
+
+from chart_xkcd import Bar, Line, Scatter
+from chart_xkcd.window import WindowStore, minmax_indices
+
+
+def test_short_ranges_are_kept_whole():
+    assert minmax_indices([5, 1, 4], 0, 3, buckets=2) == [0, 1, 2]
+    assert minmax_indices([5, 1, 4], 2, 10, buckets=2) == [2]
+
+
+def test_each_run_keeps_its_extremes_and_skips_none():
+    values = [0, 9, 1, None, 8, 2, None, None, 3, 7]
+    assert minmax_indices(values, 0, 10, buckets=2) == [0, 1, 5, 9]
+    assert minmax_indices(values, 2, 10, buckets=2) == [2, 4, 8, 9]
+
+
+def test_numpy_arrays_pick_the_same_indices():
+    np = pytest.importorskip("numpy")
+    rng = random.Random(7)
+    for _ in range(200):
+        values = [
+            rng.choice([None, rng.randint(0, 4), rng.random()]) for _ in range(97)
+        ]
+        lo, hi = rng.randint(-2, 60), rng.randint(0, 100)
+        buckets = rng.randint(1, 30)
+        array = np.array(values, dtype=float)
+        assert minmax_indices(array, lo, hi, buckets) == minmax_indices(
+            values, lo, hi, buckets
+        )
+
+
+def test_line_window_is_downsampled_by_label_index():
+    values = [(i * 37) % 101 for i in range(1000)]
+    store = WindowStore(Line(labels=list(range(1000)), datasets=[{"data": values}]))
+    config = store.window(100, 299.5, buckets=10)
+    data = config["data"]
+    assert data["window"] == {"x0": 100, "x1": 299.5, "min": 0, "max": 999}
+    assert data["labels"][0] == 100
+    assert data["labels"][-1] == 299
+    assert len(data["labels"]) <= 22
+    assert data["extent"]["y"] == [min(values[100:300]), max(values[100:300])]
+    assert data["datasets"][0]["data"] == [values[i] for i in data["labels"]]
+
+
+def test_scatter_window_selects_points_by_x():
+    day = datetime.date(2024, 1, 1)
+    points = [
+        {"x": day + datetime.timedelta(days=i), "y": i % 7} for i in range(100, 0, -1)
+    ]
+    store = WindowStore(Scatter(datasets=[{"label": "a", "data": points}]))
+    first = store.x_min
+    config = store.window(first + 10 * 86_400_000, first + 19 * 86_400_000, 600)
+    kept = config["data"]["datasets"][0]["data"]
+    assert [pt["x"] for pt in kept] == [
+        day + datetime.timedelta(days=i) for i in range(11, 21)
+    ]
+    assert config["data"]["extent"]["y"] == [0, 6]
+    assert config["data"]["datasets"][0]["label"] == "a"
+
+
+def test_window_bounds_are_clamped_and_ordered():
+    store = WindowStore(Line(labels=["a", "b", "c"], datasets=[{"data": [1, 2, 3]}]))
+    assert store.window(5, -5)["data"]["labels"] == ["a", "b", "c"]
+
+
+def test_only_line_and_scatter_can_be_windowed():
+    with pytest.raises(TypeError):
+        WindowStore(Bar(labels=["a"], datasets=[{"data": [1]}]))
+
+
+def test_text_x_values_cannot_be_windowed():
+    with pytest.raises(TypeError, match="cannot window"):
+        WindowStore(Scatter(datasets=[{"data": [{"x": "a", "y": 1}]}]))